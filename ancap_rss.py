@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 # Import necessary libraries
 import curses # For TUI (Text-based User Interface)
-import feedparser # For parsing RSS feeds (Really Simple Syndication)
-import webbrowser # For opening links in web browser
 import time # For date and time handling
 import textwrap # For adjusting text to a specific width
 import os # For interacting with the file system (e.g., checking files)
@@ -11,22 +9,32 @@ import html # For HTML entity unescaping (e.g., &amp; to &)
 import threading # For background loading of feeds
 import re # For regular expressions, used in text cleaning
 import logging
-import requests # For making HTTP requests
+import atexit # For flushing pending read-state changes on exit
+import tempfile # For atomic file writes
+import sqlite3 # For the on-disk article store
 import concurrent.futures # For concurrent thread handling
+import heapq # For merging sorted lists of entries
+import bisect # For sorted insertion into the timeline
+import calendar # For converting UTC dates to timestamps
+import hashlib # For content hashes of entries without guid or link
+from urllib.parse import parse_qsl, urlencode, urlunsplit # For canonicalizing links
+from urllib.parse import urlsplit # For grouping feeds by host
+from collections import OrderedDict # For the cache of formatted articles
+import sys # For the standard streams of batch mode
+import argparse # For the command line options
+import csv # For the CSV export
+import io # For building the --profile report
 
 # Define the base directory of this script to use absolute paths
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, 'data')
 LOGS_DIR = os.path.join(BASE_DIR, 'logs')
 
-# Ensure directories exist
-os.makedirs(DATA_DIR, exist_ok=True)
-os.makedirs(LOGS_DIR, exist_ok=True)
+# Heavy dependencies (requests, feedparser, BeautifulSoup, lxml, webbrowser, asyncio, multiprocessing and the
+# profilers) are imported by the functions that use them, so importing this module and painting the first
+# frame stay fast. Directories, logging and the saved state are set up by init_app, not at import
+startup_clock = time.perf_counter() # Reference for the first-frame time logged by main
 
-# Set up logging. Log file will be created in the logs directory
-logging.basicConfig(filename=os.path.join(LOGS_DIR, 'ancap_rss.log'), level=logging.DEBUG, format='%(asctime)s %(levelname)s: %(message)s')
-# For cleaning and parsing HTML content robustly
-from bs4 import BeautifulSoup
 # For internationalization (UI text translation)
 import gettext
 
@@ -43,13 +51,76 @@ except Exception:
 
 SIDEBAR_WIDTH = 20 # Width dedicated to the command sidebar
 HEADER_TOP_PADDING = 1
+SCREEN_MARGIN = 2 # Left and right margin of the list screens drawn with draw_screen_frame
+
+# Fetch engine: 'threads' (thread pool sharing one session) or 'asyncio' (per-host concurrency limits)
+FETCH_ENGINE = 'threads'
+MAX_CONCURRENT_FETCHES = 32 # Global budget of simultaneous requests for the asyncio engine
+MAX_FETCHES_PER_HOST = 4 # Simultaneous requests allowed against a single host by the asyncio engine
+# Processes used to parse downloaded feeds, separate from the I/O threads (0 parses on the fetch threads)
+PARSE_WORKERS = 0
+
+# Background refresh: every feed is re-polled on its own interval, derived from its
+# <ttl>/sy:updatePeriod hints and how often it actually publishes
+DEFAULT_REFRESH_INTERVAL = 30 * 60 # Seconds between polls when a feed gives no hints
+MIN_REFRESH_INTERVAL = 5 * 60 # Never poll a feed more often than this
+MAX_REFRESH_INTERVAL = 12 * 60 * 60 # Dormant feeds back off up to this
+REFRESH_BACKOFF_FACTOR = 1.5 # Interval growth when a poll brings nothing new
+REFRESH_CHECK_INTERVAL = 30 # Seconds between checks for feeds that are due
+MAX_REFRESHES_PER_CHECK = 20 # Cap on feeds polled per check, bounding request volume
+
+# Circuit breaker: feeds that keep failing are skipped and only probed with exponential backoff
+CIRCUIT_FAILURE_THRESHOLD = 3 # Consecutive failures that open a feed's circuit
+CIRCUIT_BASE_BACKOFF = 5 * 60 # Seconds before the first probe of an open circuit
+CIRCUIT_MAX_BACKOFF = 24 * 60 * 60 # Longest wait between probes
+
+# Read state is written behind: changes are batched, appended to a journal, and compacted into a snapshot
+READ_FLUSH_DELAY = 1.0 # Seconds to collect read/unread changes before appending them to the journal
+READ_COMPACT_THRESHOLD = 5000 # Journal lines that trigger rewriting the snapshot
+READ_RETENTION_DAYS = 90 # Individually read/unread articles are forgotten after this, once no feed serves them
+
+# Articles read from the store at startup, and again each time the cursor nears the end of the timeline
+ARCHIVE_PAGE_SIZE = 2000
+ARCHIVE_PREFETCH_MARGIN = 50 # Rows before the end of the timeline that trigger loading the next page
+
+# Fetch timings (connect, time to first byte, download, parse) kept per feed for the timing screen
+FEED_STATS_WINDOW = 50 # Latest fetches of each feed that the percentiles are computed over
+
+# --profile: reports written to LOGS_DIR on exit
+PROFILE_REPORT_LINES = 30 # Functions and allocation sites listed per report
+PROFILE_TRACEMALLOC_FRAMES = 10 # Stack depth recorded for each allocation
+
+# Most relevant matches shown for a search
+SEARCH_RESULT_LIMIT = 500
+# Engine turning article HTML into text: 'lxml' (fast, C parser) or 'bs4' (BeautifulSoup, also the fallback)
+HTML_ENGINE = 'lxml'
+# Formatted article bodies kept in memory, so scrolling or coming back to an article doesn't parse it again
+FORMAT_CACHE_SIZE = 64
+# Articles before and after the one being read that are formatted ahead of time in the background
+PRERENDER_NEIGHBOURS = 2
 
 FEEDS = [] # Empty global list that is later filled with custom feeds
 
 # Name of the file to save read article IDs/links
 READ_FILE = os.path.join(DATA_DIR, 'read_articles.json')
+# Append-only journal of read/unread changes made since READ_FILE was last written
+READ_JOURNAL_FILE = os.path.join(DATA_DIR, 'read_articles.journal')
 # Name of the file to save favorite article links
 FAVORITES_FILE = os.path.join(DATA_DIR, 'favorites.json')
+# Name of the file to save HTTP validators (ETag/Last-Modified) and the last entries of each feed
+FEED_CACHE_FILE = os.path.join(DATA_DIR, 'feed_cache.json')
+
+# SQLite database keeping every article ever fetched, so the timeline survives restarts
+ARTICLES_DB = os.path.join(DATA_DIR, 'articles.db')
+# Name of the file to save the health (failures and circuit state) of each feed
+FEED_HEALTH_FILE = os.path.join(DATA_DIR, 'feed_health.json')
+# Name of the file to save the latest fetch timings of each feed
+FEED_STATS_FILE = os.path.join(DATA_DIR, 'feed_stats.json')
+
+# Entry fields kept from each parsed entry
+PARSED_ENTRY_FIELDS = ('id', 'title', 'link', 'summary', 'published', 'updated')
+# Channel fields used to decide how often a feed is polled
+FEED_HINT_FIELDS = ('ttl', 'sy_updateperiod', 'sy_updatefrequency')
 
 # Read additional feeds from custom_feeds.json if it exists
 def load_custom_feeds():
@@ -68,103 +139,1514 @@ def load_custom_feeds():
             return [] # In case of error, return an empty list
     return [] # If the file doesn't exist, return an empty list
 
-# Save read articles
-def save_read_articles():
-    # Open the read articles file in write mode
-    with open(READ_FILE, 'w', encoding='utf-8') as f:
-        # Save the set of read articles as a JSON list
-        json.dump(list(read_articles), f)
-
-# Load read articles
+# Write a file so that readers see either the old or the new content, never a truncated one
+def write_file_atomically(path, text):
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.' + os.path.basename(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path) # Atomic on POSIX and Windows
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+# Read state is a per-feed watermark ("everything up to this timestamp is read") plus the articles
+# read or unread against it, so marking a whole feed costs one entry however many articles it has
+def is_read(article):
+    link = article.link
+    if link in unread_articles:
+        return False
+    if link in read_articles:
+        return True
+    # Undated articles (timestamp 0) are never under a watermark: they would all arrive already read
+    return 0 < article.timestamp <= read_watermarks.get(article.source_title, -1)
+
+# Apply one read-state change, as recorded in the journal
+def apply_read_change(change):
+    op = change[0]
+    if op == 'r': # ['r', link, feed, timestamp, marked at]
+        link, feed, timestamp = change[1:4]
+        marked_at = change[4] if len(change) > 4 else time.time() # Older journals didn't record when
+        unread_articles.pop(link, None)
+        if timestamp == 0 or timestamp > read_watermarks.get(feed, -1):
+            read_articles[link] = [feed, timestamp, marked_at]
+    elif op == 'u': # ['u', link, feed, timestamp, marked at]
+        link, feed, timestamp = change[1:4]
+        marked_at = change[4] if len(change) > 4 else time.time()
+        read_articles.pop(link, None)
+        if 0 < timestamp <= read_watermarks.get(feed, -1):
+            unread_articles[link] = [feed, timestamp, marked_at]
+    elif op == 'w': # ['w', feed, timestamp]: everything of the feed up to timestamp is read
+        feed, timestamp = change[1:]
+        read_watermarks[feed] = max(timestamp, read_watermarks.get(feed, -1))
+        for exceptions in (read_articles, unread_articles):
+            for link in [link for link, (f, ts, marked_at) in exceptions.items() if f == feed and 0 < ts <= timestamp]:
+                del exceptions[link]
+    elif op == 'c': # ['c']: everything is unread, ['c', feed]: everything of the feed is unread
+        if len(change) == 1:
+            read_watermarks.clear()
+            read_articles.clear()
+            unread_articles.clear()
+        else:
+            feed = change[1]
+            read_watermarks.pop(feed, None)
+            for exceptions in (read_articles, unread_articles):
+                for link in [link for link, (f, ts, marked_at) in exceptions.items() if f == feed]:
+                    del exceptions[link]
+
+# Apply a read-state change now; it reaches disk with the next batched flush
+def record_read_change(change):
+    with read_state_lock:
+        apply_read_change(change)
+        pending_read_changes.append(change)
+    schedule_read_flush()
+
+# Mark an article as read
+def mark_read(article):
+    global timeline_version
+    with entries_lock: # No merge may count the article between the change and the counter update
+        if article.link and not is_read(article):
+            for timeline in unread_views(article): # Taken out while still counted as unread
+                timeline.discard(article)
+            timeline_version += 1 # The unread views changed
+            record_read_change(['r', article.link, article.source_title, article.timestamp, time.time()])
+            update_read_stats(article)
+
+# Mark an article as unread
+def mark_unread(article):
+    global timeline_version
+    with entries_lock: # No merge may count the article between the change and the counter update
+        if article.link and is_read(article):
+            record_read_change(['u', article.link, article.source_title, article.timestamp, time.time()])
+            update_read_stats(article)
+            if article in entries:
+                for timeline in unread_views(article):
+                    timeline.add(article)
+                timeline_version += 1
+
+# Mark a list of articles as read. When it holds every loaded (or every unread) article of its feeds,
+# like the timeline and its per-feed and unread views, each feed only moves its watermark up to its newest one
+def mark_all_read(articles):
+    if not articles.whole_feeds:
+        for article in articles:
+            mark_read(article)
+        return
+    newest = {}
+    for article in articles:
+        if article.timestamp == 0:
+            if article.link and not is_read(article):
+                # No watermark covers undated articles; they are marked one by one
+                record_read_change(['r', article.link, article.source_title, 0, time.time()])
+        elif article.timestamp > newest.get(article.source_title, -1):
+            newest[article.source_title] = article.timestamp
+    for feed, timestamp in newest.items():
+        record_read_change(['w', feed, timestamp])
+    recount_read_stats()
+
+# Mark a list of articles as unread. For whole feeds this just drops their read state
+def mark_all_unread(articles):
+    if articles.whole_feeds:
+        if articles is entries:
+            record_read_change(['c'])
+        else:
+            for feed in {article.source_title for article in articles}:
+                record_read_change(['c', feed])
+        recount_read_stats()
+        return
+    for article in articles:
+        mark_unread(article)
+
+# Forget read/unread marks recorded more than READ_RETENTION_DAYS ago for articles nothing can show any more.
+# Only feeds fetched successfully in this run (fetched_feeds, by title) tell what they no longer serve: a failing
+# feed may serve its articles again. Articles still in the store can come back with the archive, so they are kept
+def prune_read_history(fetched_feeds):
+    cutoff = time.time() - READ_RETENTION_DAYS * 24 * 60 * 60
+    pruned = 0
+    with read_state_lock:
+        for exceptions in (read_articles, unread_articles):
+            stale = [link for link, (feed, timestamp, marked_at) in exceptions.items()
+                     if feed in fetched_feeds and marked_at < cutoff and link not in favorite_links
+                     and 'link:' + canonicalize_link(link) not in entry_index]
+            if not stale:
+                continue
+            stored = find_stored_links(stale)
+            for link in stale:
+                if link not in stored:
+                    del exceptions[link]
+                    pruned += 1
+    if pruned:
+        logging.debug(f'Pruned {pruned} old read-state entries.')
+    return pruned
+
+# Debounce: flush once after READ_FLUSH_DELAY, however many changes happen meanwhile
+def schedule_read_flush():
+    global read_flush_timer
+    with read_state_lock:
+        if read_flush_timer is None:
+            read_flush_timer = threading.Timer(READ_FLUSH_DELAY, flush_read_articles)
+            read_flush_timer.daemon = True
+            read_flush_timer.start()
+
+# Append pending read-state changes to the journal, compacting it into the snapshot when it grows too long
+def flush_read_articles():
+    global read_flush_timer, read_journal_lines
+    with read_state_lock:
+        read_flush_timer = None
+        changes, pending_read_changes[:] = pending_read_changes[:], []
+        if not changes:
+            return
+        try:
+            with open(READ_JOURNAL_FILE, 'a', encoding='utf-8') as f:
+                f.write(''.join(json.dumps(change) + '\n' for change in changes))
+            read_journal_lines += len(changes)
+            if read_journal_lines >= READ_COMPACT_THRESHOLD:
+                compact_read_articles()
+        except Exception as e:
+            logging.error(f"Error saving read articles to {READ_JOURNAL_FILE}: {e}", exc_info=True)
+
+# Rewrite the snapshot with the current read state and start an empty journal
+def compact_read_articles():
+    global read_journal_lines
+    with read_state_lock:
+        snapshot = {'watermarks': read_watermarks, 'read': read_articles, 'unread': unread_articles}
+        write_file_atomically(READ_FILE, json.dumps(snapshot))
+        # The journal only holds changes newer than the snapshot; a crash before this line just replays them again
+        write_file_atomically(READ_JOURNAL_FILE, '')
+        read_journal_lines = 0
+        pending_read_changes.clear() # Already in the snapshot; appending them later would replay pruned marks
+    logging.debug(f'Compacted read articles into {READ_FILE}.')
+
+# Load read state: the snapshot plus the changes journaled since it was written
 def load_read_articles():
+    global read_journal_lines
+    now = time.time()
     if os.path.exists(READ_FILE): # Check if the read articles file exists
         try:
             with open(READ_FILE, 'r', encoding='utf-8') as f: # Open the file in read mode
-                # Load the JSON list and convert it to a set for efficient searches
-                return set(json.load(f))
+                snapshot = json.load(f)
+            if isinstance(snapshot, list):
+                # Older versions kept a plain list of read links; keep them for a retention period
+                read_articles.update((link, [None, 0, now]) for link in snapshot)
+            else:
+                read_watermarks.update(snapshot.get('watermarks', {}))
+                read_articles.update(snapshot.get('read', {}))
+                unread_articles.update(snapshot.get('unread', {}))
+                for exceptions in (read_articles, unread_articles):
+                    for record in exceptions.values():
+                        if len(record) < 3:
+                            record.append(now) # Saved before marks recorded when they were made
         except Exception as e: # Catch errors during loading
             logging.error(f"Error loading read articles from {READ_FILE}: {e}", exc_info=True)
-            return set() # In case of error, return an empty set
-    return set() # If the file doesn't exist, return an empty set
+    if os.path.exists(READ_JOURNAL_FILE):
+        try:
+            complete_bytes = 0
+            with open(READ_JOURNAL_FILE, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.endswith('\n'):
+                        # Torn last line from a crash mid-append: cut it so the next append starts on a fresh line
+                        os.truncate(READ_JOURNAL_FILE, complete_bytes)
+                        break
+                    complete_bytes += len(line.encode('utf-8'))
+                    read_journal_lines += 1
+                    if line[0] == '[':
+                        apply_read_change(json.loads(line))
+                    elif line[0] == '+': # Older '+link' / '-link' journal lines
+                        apply_read_change(['r', line[1:-1], None, 0, now])
+                    elif line[0] == '-':
+                        read_articles.pop(line[1:-1], None)
+        except Exception as e:
+            logging.error(f"Error loading read articles journal from {READ_JOURNAL_FILE}: {e}", exc_info=True)
 
-# Save favorites to JSON file
+# Save favorites to JSON file, as full snapshots so they outlive the feeds that published them
 def save_favorites():
-    # Open the favorites file in write mode
-    with open(FAVORITES_FILE, 'w', encoding='utf-8') as f:
-        # Save only the links of favorite articles
-        json.dump([getattr(fav, 'link', '') for fav in favorites], f)
+    with entries_lock:
+        records = [{field: getattr(fav, field) for field in Article.__slots__} if fav is not None else link
+                   for link, fav in favorite_links.items()]
+    try:
+        write_file_atomically(FAVORITES_FILE, json.dumps(records))
+    except Exception as e:
+        logging.error(f"Error saving favorites to {FAVORITES_FILE}: {e}", exc_info=True)
 
-# Load favorites from JSON file
+# Load favorites from JSON file: link -> article snapshot
 def load_favorites():
+    favorites_by_link = {}
     if os.path.exists(FAVORITES_FILE): # Check if the favorites file exists
         try:
             with open(FAVORITES_FILE, 'r', encoding='utf-8') as f: # Open the file in read mode
-                # Load the list of links and convert it to a set
-                return set(json.load(f))
+                for record in json.load(f):
+                    if isinstance(record, str):
+                        # Older versions saved only the link; the article is filled in once a feed serves it again
+                        favorites_by_link[record] = None
+                    else:
+                        favorites_by_link[record['link']] = Article(**record)
         except Exception as e: # Catch errors during loading
             logging.error(f"Error loading favorites from {FAVORITES_FILE}: {e}", exc_info=True)
-            return set() # In case of error, return an empty set
-    return set() # If the file doesn't exist, return an empty set
-
-
-# Initial loading of feeds and favorites
-FEEDS = load_custom_feeds() # Load custom feeds at program startup
-# Load previously marked read articles
-read_articles = load_read_articles()
-favorites = [] # List to store favorite article objects in memory
-# Load favorite article links for verification
-favorite_links = load_favorites()
-total_entries = [] # Global list that will contain all entries from all feeds
+    return favorites_by_link
+
+# Load the conditional GET cache (url -> {'etag', 'last_modified', 'entries'})
+def load_feed_cache():
+    if os.path.exists(FEED_CACHE_FILE): # Check if the feed cache file exists
+        try:
+            with open(FEED_CACHE_FILE, 'r', encoding='utf-8') as f: # Open the file in read mode
+                cache = json.load(f)
+                # Ignore anything that is not a mapping of urls (e.g., a corrupted file)
+                return cache if isinstance(cache, dict) else {}
+        except Exception as e: # Catch errors during loading
+            logging.error(f"Error loading feed cache from {FEED_CACHE_FILE}: {e}", exc_info=True)
+            return {} # In case of error, return an empty cache
+    return {} # If the file doesn't exist, return an empty cache
+
+# Save the conditional GET cache
+def save_feed_cache():
+    try:
+        with feed_cache_lock: # Fetch threads update the cache concurrently
+            data = json.dumps(feed_cache)
+        write_file_atomically(FEED_CACHE_FILE, data)
+    except Exception as e:
+        logging.error(f"Error saving feed cache to {FEED_CACHE_FILE}: {e}", exc_info=True)
+
+# Load the health records of the feeds (url -> failures, last success, circuit state)
+def load_feed_health():
+    if os.path.exists(FEED_HEALTH_FILE): # Check if the feed health file exists
+        try:
+            with open(FEED_HEALTH_FILE, 'r', encoding='utf-8') as f: # Open the file in read mode
+                health = json.load(f)
+                if not isinstance(health, dict):
+                    return {}
+                for record in health.values():
+                    # A probe interrupted by exiting the program counts as not attempted
+                    if record.get('state') == 'half_open':
+                        record['state'] = 'open'
+                return health
+        except Exception as e: # Catch errors during loading
+            logging.error(f"Error loading feed health from {FEED_HEALTH_FILE}: {e}", exc_info=True)
+            return {} # In case of error, start with every feed healthy
+    return {} # If the file doesn't exist, every feed starts healthy
+
+# Save the health records of the feeds
+def save_feed_health():
+    try:
+        with feed_health_lock:
+            data = json.dumps(feed_health)
+        write_file_atomically(FEED_HEALTH_FILE, data)
+    except Exception as e:
+        logging.error(f"Error saving feed health to {FEED_HEALTH_FILE}: {e}", exc_info=True)
+
+# Load the latest fetch timings of the feeds (url -> title and samples)
+def load_feed_stats():
+    if os.path.exists(FEED_STATS_FILE):
+        try:
+            with open(FEED_STATS_FILE, 'r', encoding='utf-8') as f:
+                stats = json.load(f)
+                return stats if isinstance(stats, dict) else {}
+        except Exception as e:
+            logging.error(f"Error loading feed stats from {FEED_STATS_FILE}: {e}", exc_info=True)
+            return {}
+    return {}
+
+# Save the latest fetch timings of the feeds
+def save_feed_stats():
+    try:
+        with feed_stats_lock:
+            data = json.dumps(feed_stats)
+        write_file_atomically(FEED_STATS_FILE, data)
+    except Exception as e:
+        logging.error(f"Error saving feed stats to {FEED_STATS_FILE}: {e}", exc_info=True)
+
+# Convert a parsed entry into a compact, picklable dict
+def compact_entry(entry):
+    compact = {field: entry[field] for field in PARSED_ENTRY_FIELDS if field in entry}
+    for field in ('published_parsed', 'updated_parsed'):
+        parsed_date = getattr(entry, field, None)
+        if parsed_date:
+            compact[field] = list(parsed_date)
+    return compact
+
+# Compact article record, normalized once at ingestion so rendering and sorting
+# never have to unescape, format dates or convert timestamps again
+class Article:
+    __slots__ = ('id', 'link', 'title', 'source_title', 'timestamp', 'date_text', 'datetime_text', 'summary')
+
+    def __init__(self, id, link, title, source_title, timestamp, date_text, datetime_text, summary):
+        self.id = id # guid of the entry, if the feed provides one
+        self.link = link
+        self.title = title # Already unescaped
+        self.source_title = source_title
+        self.timestamp = timestamp # Publication (or else last update) time as epoch seconds (0 if unknown)
+        self.date_text = date_text # dd/mm/yyyy, shown in the article list
+        self.datetime_text = datetime_text # dd/mm/yyyy hh:mm, shown in reading mode
+        self.summary = summary # Raw HTML summary
+
+    # Build an article from an entry dict produced by parse_feed_content
+    @classmethod
+    def from_parsed(cls, parsed, source_title):
+        # Atom entries often only have <updated>
+        published_parsed = parsed.get('published_parsed') or parsed.get('updated_parsed')
+        if published_parsed:
+            published_parsed = time.struct_time(published_parsed)
+            timestamp = calendar.timegm(published_parsed)
+            date_text = time.strftime('%d/%m/%Y', published_parsed)
+            datetime_text = time.strftime('%d/%m/%Y %H:%M', published_parsed)
+        else:
+            timestamp = 0
+            date_text = time.strftime('%d/%m/%Y', time.gmtime(0))
+            datetime_text = html.unescape(parsed.get('published', parsed.get('updated', _('No Date'))))
+        return cls(parsed.get('id'), parsed.get('link'), html.unescape(parsed.get('title', _('No Title'))),
+                   source_title, timestamp, date_text, datetime_text, parsed.get('summary', _('No content available')))
+
+# Counters of a timeline, kept up to date as articles come and go and change read state,
+# so the header never has to scan the timeline
+class TimelineStats:
+    __slots__ = ('total', 'unread', 'by_feed')
+
+    def __init__(self):
+        self.total = 0
+        self.unread = 0
+        self.by_feed = {} # Feed title -> [total, unread]
+
+    # Count an article in (sign=1) or out (sign=-1)
+    def count(self, article, sign):
+        unread = 0 if is_read(article) else sign
+        self.total += sign
+        self.unread += unread
+        feed_counts = self.by_feed.setdefault(article.source_title, [0, 0])
+        feed_counts[0] += sign
+        feed_counts[1] += unread
+
+    # An article already counted was marked read or unread
+    def read_changed(self, article, now_read):
+        delta = -1 if now_read else 1
+        self.unread += delta
+        self.by_feed[article.source_title][1] += delta
+
+    # Start over from the articles themselves, after a change touching many of them at once
+    def recount(self, articles):
+        self.__init__()
+        for article in articles:
+            self.count(article, 1)
+
+# Articles kept sorted newest first. Positions are found by binary search on the sort keys,
+# so inserting, removing and locating an article costs O(log n) comparisons
+class Timeline:
+    whole_feeds = False # True for lists holding every loaded article of their feeds (see mark_all_read)
+
+    # Newest first; id() breaks ties so every key is unique and articles are never compared
+    @staticmethod
+    def key(article):
+        return (-article.timestamp, id(article))
+
+    def __init__(self, articles=()):
+        self._keys = []
+        self._items = []
+        self.stats = TimelineStats()
+        self.merge([articles])
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index): # Integer index or slice, like a list
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    # Position of an article, or -1 if it is not in the timeline
+    def index_of(self, article):
+        key = self.key(article)
+        pos = bisect.bisect_left(self._keys, key)
+        if pos < len(self._keys) and self._keys[pos] == key:
+            return pos
+        return -1
+
+    def __contains__(self, article):
+        return self.index_of(article) >= 0
+
+    # (position, True) of an article, or (position it would have, False) if it is not in the timeline
+    def locate(self, article):
+        key = self.key(article)
+        pos = bisect.bisect_left(self._keys, key)
+        return pos, pos < len(self._keys) and self._keys[pos] == key
+
+    def add(self, article):
+        key = self.key(article)
+        pos = bisect.bisect_left(self._keys, key)
+        if pos < len(self._keys) and self._keys[pos] == key:
+            return # Already there
+        self._keys.insert(pos, key)
+        self._items.insert(pos, article)
+        self.stats.count(article, 1)
+
+    # Remove an article; its timestamp must not have changed since it was added
+    def discard(self, article):
+        pos = self.index_of(article)
+        if pos >= 0:
+            del self._keys[pos]
+            del self._items[pos]
+            self.stats.count(article, -1)
+
+    def clear(self):
+        self._keys = []
+        self._items = []
+        self.stats = TimelineStats()
+
+    # k-way merge of several streams of articles (e.g., one per feed) into the timeline.
+    # Feeds are mostly sorted already, so sorting each stream is close to linear
+    def merge(self, streams):
+        sorted_streams = []
+        new_keys = set()
+        for stream in streams:
+            pairs = []
+            for article in stream:
+                key = self.key(article)
+                if key not in new_keys and self.index_of(article) < 0: # The same article present twice is kept once
+                    new_keys.add(key)
+                    pairs.append((key, article))
+            if pairs:
+                pairs.sort(key=lambda pair: pair[0])
+                sorted_streams.append(pairs)
+        new_count = sum(len(pairs) for pairs in sorted_streams)
+        if new_count <= 16:
+            # A handful of articles: binary-search each one into place
+            for pairs in sorted_streams:
+                for key, article in pairs:
+                    self.add(article)
+            return
+        keys, items = [], []
+        for key, article in heapq.merge(zip(self._keys, self._items), *sorted_streams, key=lambda pair: pair[0]):
+            keys.append(key)
+            items.append(article)
+        self._keys, self._items = keys, items
+        for pairs in sorted_streams:
+            for key, article in pairs:
+                self.stats.count(article, 1)
+
+# Search results, kept in order of relevance instead of date
+class SearchResults(Timeline):
+    def __init__(self, articles):
+        self.ranks = {} # id(article) -> position in the ranking
+        for article in articles:
+            self.ranks.setdefault(id(article), len(self.ranks))
+        super().__init__(articles)
+
+    def key(self, article):
+        return (self.ranks.get(id(article), len(self.ranks)), id(article))
+
+# Open the article store on first use, creating its tables and indexes if needed
+def get_article_store():
+    global article_store
+    with article_store_lock:
+        if article_store is None:
+            # Shared by the UI and fetch threads; every access goes through article_store_lock
+            connection = sqlite3.connect(ARTICLES_DB, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('''CREATE TABLE IF NOT EXISTS articles (
+                guid TEXT PRIMARY KEY, feed_url TEXT, id TEXT, link TEXT, title TEXT, source_title TEXT,
+                timestamp REAL, date_text TEXT, datetime_text TEXT, summary TEXT)''')
+            connection.execute('CREATE INDEX IF NOT EXISTS articles_by_feed ON articles (feed_url, timestamp)')
+            connection.execute('CREATE INDEX IF NOT EXISTS articles_by_time ON articles (timestamp, guid)')
+            first = connection.execute('SELECT guid FROM articles LIMIT 1').fetchone()
+            if first is not None and '\0' not in first[0]:
+                # Stored before keys were scoped to their feed (see entry_key); rowids, and so the search index, are kept
+                connection.execute("UPDATE articles SET guid = feed_url || char(0) || guid")
+                logging.info(f'Scoped the keys of the articles in {ARTICLES_DB} to their feeds.')
+            try:
+                # Full-text index of title, source and summary text; its rowids are those of articles
+                connection.execute("""CREATE VIRTUAL TABLE IF NOT EXISTS article_search USING fts5(
+                    title, source_title, body, tokenize='unicode61 remove_diacritics 2', prefix='2 3')""")
+            except sqlite3.OperationalError as e: # SQLite built without FTS5
+                logging.error(f"Search is unavailable, the FTS5 extension is missing: {e}", exc_info=True)
+            connection.commit()
+            article_store = connection
+        return article_store
+
+# Columns read back into Article records, in constructor order
+STORED_ARTICLE_COLUMNS = 'id, link, title, source_title, timestamp, date_text, datetime_text, summary'
+
+# Insert or update the articles of a feed in the store, keeping the search index in step
+def store_articles(url, articles):
+    rows = [(entry_key(url, a), url, a.id, a.link, a.title, a.source_title, a.timestamp, a.date_text, a.datetime_text, a.summary)
+            for a in articles]
+    try:
+        store = get_article_store()
+        with article_store_lock:
+            stored = {}
+            # Stay well below SQLite's limit on query parameters
+            for start in range(0, len(rows), 500):
+                chunk = [row[0] for row in rows[start:start + 500]]
+                stored.update((row[0], row) for row in store.execute(f'SELECT * FROM articles WHERE guid IN ({",".join("?" * len(chunk))})', chunk))
+        # A feed mostly serves the articles already stored: write only new and changed ones,
+        # and extract the searchable text (before taking the lock) only where the indexed fields changed
+        rows = [row for row in rows if stored.get(row[0]) != row]
+        search_rows = [(row[4], row[5], html_to_text(row[9] or '')[0], row[0]) for row in rows
+                       if row[0] not in stored or (row[4], row[5], row[9]) != tuple(stored[row[0]][i] for i in (4, 5, 9))]
+        if not rows:
+            return
+        with article_store_lock:
+            # An upsert keeps the rowid of an updated article, which is also its rowid in the search index
+            store.executemany('INSERT INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (guid) DO UPDATE SET '
+                              'feed_url = excluded.feed_url, id = excluded.id, link = excluded.link, title = excluded.title, '
+                              'source_title = excluded.source_title, timestamp = excluded.timestamp, date_text = excluded.date_text, '
+                              'datetime_text = excluded.datetime_text, summary = excluded.summary', rows)
+            if search_rows and search_available(store):
+                store.executemany('INSERT OR REPLACE INTO article_search (rowid, title, source_title, body) '
+                                  'SELECT rowid, ?, ?, ? FROM articles WHERE guid = ?', search_rows)
+            store.commit()
+    except sqlite3.Error as e:
+        logging.error(f"Error storing articles from {url} in {ARTICLES_DB}: {e}", exc_info=True)
+
+# Load stored articles by identity (e.g., the entries of a feed that answered 304)
+def load_articles_by_key(keys):
+    articles = []
+    try:
+        store = get_article_store()
+        with article_store_lock:
+            # Stay well below SQLite's limit on query parameters
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = store.execute(f'SELECT {STORED_ARTICLE_COLUMNS} FROM articles WHERE guid IN ({",".join("?" * len(chunk))})', chunk).fetchall()
+                articles.extend(Article(*row) for row in rows)
+    except sqlite3.Error as e:
+        logging.error(f"Error loading articles from {ARTICLES_DB}: {e}", exc_info=True)
+    return articles
+
+# The links among the given ones that the article store holds (the archive can still show them)
+def find_stored_links(links):
+    found = set()
+    try:
+        store = get_article_store()
+        with article_store_lock:
+            for start in range(0, len(links), 500):
+                chunk = links[start:start + 500]
+                found.update(row[0] for row in store.execute(f'SELECT link FROM articles WHERE link IN ({",".join("?" * len(chunk))})', chunk))
+    except sqlite3.Error as e:
+        logging.error(f"Error looking up links in {ARTICLES_DB}: {e}", exc_info=True)
+        return set(links) # When unsure, treat them all as stored
+    return found
+
+# Whether the store has its search index (SQLite may lack FTS5)
+def search_available(store):
+    return store.execute("SELECT 1 FROM sqlite_master WHERE name = 'article_search'").fetchone() is not None
+
+# Index articles stored before the search index existed. Runs once, in batches, in the background
+def index_archive_for_search():
+    try:
+        store = get_article_store()
+        with article_store_lock:
+            if store.execute('PRAGMA user_version').fetchone()[0] >= 1 or not search_available(store):
+                return
+        last_rowid, indexed = 0, 0
+        while True:
+            with article_store_lock:
+                rows = store.execute('SELECT rowid, title, source_title, summary FROM articles WHERE rowid > ? ORDER BY rowid LIMIT 500',
+                                     (last_rowid,)).fetchall()
+            if not rows:
+                break
+            search_rows = [(rowid, title, source_title, html_to_text(summary or '')[0]) for rowid, title, source_title, summary in rows]
+            with article_store_lock:
+                store.executemany('INSERT OR REPLACE INTO article_search (rowid, title, source_title, body) VALUES (?, ?, ?, ?)', search_rows)
+                store.commit()
+            last_rowid = rows[-1][0]
+            indexed += len(rows)
+        with article_store_lock:
+            store.execute('PRAGMA user_version = 1') # Everything stored from now on is indexed as it arrives
+            store.commit()
+        logging.debug(f'Indexed {indexed} archived articles for search.')
+    except sqlite3.Error as e:
+        logging.error(f"Error indexing {ARTICLES_DB} for search: {e}", exc_info=True)
+
+# Turn what the user typed into an FTS5 query: every word must match, and a word ending in * matches as a prefix
+def build_search_query(text):
+    terms = []
+    for word in re.findall(r'\w+\*?', text):
+        prefix = word.endswith('*')
+        terms.append('"' + word.rstrip('*') + '"' + ('*' if prefix else ''))
+    return ' AND '.join(terms)
+
+# Stored articles matching a search, best first: title matches weigh most, then source, then body text
+def find_stored_articles(text):
+    query = build_search_query(text)
+    if not query:
+        return []
+    try:
+        store = get_article_store()
+        with article_store_lock:
+            if not search_available(store):
+                return []
+            columns = ', '.join('articles.' + column for column in STORED_ARTICLE_COLUMNS.split(', '))
+            # Rank the matching rowids first, so only the best ones are joined with their articles
+            rows = store.execute(f'SELECT {columns} FROM (SELECT rowid, bm25(article_search, 10.0, 4.0, 1.0) AS score '
+                                 f'FROM article_search WHERE article_search MATCH ? ORDER BY score LIMIT ?) AS best '
+                                 f'JOIN articles ON articles.rowid = best.rowid ORDER BY best.score',
+                                 (query, SEARCH_RESULT_LIMIT)).fetchall()
+        return [Article(*row) for row in rows]
+    except sqlite3.Error as e:
+        logging.error(f"Error searching {ARTICLES_DB} for {text!r}: {e}", exc_info=True)
+        return []
+
+# Read one page of stored articles, newest first, after the (timestamp, guid) cursor of the previous page;
+# feed_urls limits it to those feeds through the articles_by_feed index
+def read_archive_rows(cursor, feed_urls=None):
+    clauses, params = [], []
+    if feed_urls is not None:
+        clauses.append(f'feed_url IN ({", ".join("?" * len(feed_urls))})')
+        params.extend(feed_urls)
+    if cursor is not None:
+        # Keyset pagination: (timestamp, guid) strictly after the last row of the previous page
+        timestamp, guid = cursor
+        clauses.append('(timestamp < ? OR (timestamp = ? AND guid < ?))')
+        params.extend((timestamp, timestamp, guid))
+    where = f'WHERE {" AND ".join(clauses)} ' if clauses else ''
+    store = get_article_store()
+    with article_store_lock:
+        return store.execute(f'SELECT {STORED_ARTICLE_COLUMNS}, guid FROM articles {where}'
+                             'ORDER BY timestamp DESC, guid DESC LIMIT ?',
+                             params + [ARCHIVE_PAGE_SIZE]).fetchall()
+
+# Load the next page of the archive, newest first, continuing after the last page read
+def load_archive_page():
+    global archive_cursor, archive_exhausted
+    if archive_exhausted:
+        return []
+    try:
+        rows = read_archive_rows(archive_cursor)
+    except sqlite3.Error as e:
+        logging.error(f"Error loading archive page from {ARTICLES_DB}: {e}", exc_info=True)
+        return []
+    if len(rows) < ARCHIVE_PAGE_SIZE:
+        archive_exhausted = True
+    if rows:
+        archive_cursor = (rows[-1][4], rows[-1][-1])
+    logging.debug(f'Loaded {len(rows)} articles from the archive.')
+    return [Article(*row[:-1]) for row in rows]
+
+# Load the next page of one feed's archive for its per-feed view, which the global pages may not reach
+def load_feed_archive_page(source):
+    if archive_exhausted or source in archive_feeds_exhausted:
+        return []
+    feed_urls = [url for name, url in FEEDS if name == source]
+    if not feed_urls: # Feed no longer configured: its stored articles only come in with the global pages
+        archive_feeds_exhausted.add(source)
+        return []
+    try:
+        rows = read_archive_rows(archive_feed_cursors.get(source), feed_urls)
+    except sqlite3.Error as e:
+        logging.error(f"Error loading archive page of {source} from {ARTICLES_DB}: {e}", exc_info=True)
+        return []
+    if len(rows) < ARCHIVE_PAGE_SIZE:
+        archive_feeds_exhausted.add(source)
+    if rows:
+        archive_feed_cursors[source] = (rows[-1][4], rows[-1][-1])
+    logging.debug(f'Loaded {len(rows)} articles of {source} from the archive.')
+    return [Article(*row[:-1]) for row in rows]
+
+# Application state, filled from the data files by init_app
+read_state_lock = threading.RLock() # Guards the read state and the pending journal changes
+pending_read_changes = [] # Changes not yet appended to the journal
+read_flush_timer = None # Timer of the next batched flush, if one is scheduled
+read_journal_lines = 0 # Lines in the journal since the last compaction
+read_watermarks = {} # Feed title -> timestamp up to which all its articles are read
+read_articles = {} # Link -> [feed title, timestamp, marked at] of articles read above their feed's watermark
+unread_articles = {} # Link -> [feed title, timestamp, marked at] of articles unread below their feed's watermark
+# Favorite articles by link (None until an article saved by an older version shows up again)
+favorite_links = {}
+favorites = Timeline() # Favorite articles, newest first
+total_entries = Timeline() # Global timeline that will contain all entries from all feeds
 # Global list used to display entries (can be filtered/total)
-entries = []
+entries = Timeline()
+entries.whole_feeds = True
+# Filtered views of entries, maintained alongside it: per feed, and unread only (overall and per feed)
+entries_by_feed = {} # Feed title -> Timeline
+unread_entries = Timeline()
+unread_entries.whole_feeds = True
+unread_by_feed = {} # Feed title -> Timeline
 loading_done = False # Flag to indicate if feed loading is finished
 entries_loaded = 0 # Counter to know how many feeds have been processed
+feed_view = None # Windows of the article list screen (see FeedView), created on first draw
+open_views = [] # Other lists on screen (e.g., search results), whose counters follow read changes too
+# Seconds per period of the RSS syndication module (sy:updatePeriod)
+SY_UPDATE_PERIODS = {'hourly': 3600, 'daily': 86400, 'weekly': 604800, 'monthly': 2592000, 'yearly': 31536000}
+
+# Per-feed refresh state: url -> {'interval': seconds, 'next': epoch of the next poll}
+feed_schedule = {}
+feed_schedule_lock = threading.Lock()
+# Guards entries, total_entries and favorites while finished feeds are merged in the background
+entries_lock = threading.RLock()
+timeline_version = 0 # Bumped every time the timeline changes, so views can keep their selection
+entry_index = {} # De-duplication index: identity key (guid, canonical link or content hash) -> article in the timeline
+# Validators and last entries of each feed, used to send conditional requests
+feed_cache = {}
+feed_cache_lock = threading.Lock()
+# Process pool for parsing feeds, started on first use when PARSE_WORKERS > 0
+parse_pool = None
+parse_pool_lock = threading.Lock()
+# Least recently used formatted articles: (article, width) -> (summary it was made from, format_html_content result)
+format_cache = OrderedDict()
+format_cache_width = None # Width of the cached articles; a resize empties the cache
+format_cache_lock = threading.Lock()
+# Latest (timeline, index, width) of reading mode for the pre-render worker; a newer one replaces it
+prerender_request = None
+prerender_condition = threading.Condition()
+prerender_thread = None # Started the first time an article is read
+# Connection to the SQLite article store, opened on first use
+article_store = None
+article_store_lock = threading.Lock()
+archive_cursor = None # (timestamp, guid) of the last archived article loaded into the timeline
+archive_exhausted = False # True once every stored article has been loaded
+archive_feed_cursors = {} # Feed title -> (timestamp, guid) of the last of its archived articles loaded for its view
+archive_feeds_exhausted = set() # Feed titles whose stored articles have all been loaded
+# Health of each feed, used to skip feeds whose circuit is open
+feed_health = {}
+feed_health_lock = threading.Lock()
+
+# Profiles accumulated with --profile: activity ('fetch', 'merge', or the screen handling a key) -> pstats.Stats.
+# None when not profiling
+profile_stats = None
+profile_skipped = {} # Activity -> runs left out because another profiler was active (Python 3.12+ allows one)
+profile_lock = threading.Lock()
+memory_snapshots = [] # (label, tracemalloc snapshot) taken while profiling
+# Latest fetch timings of each feed (see record_fetch_sample)
+feed_stats = {}
+feed_stats_lock = threading.Lock()
+# Seconds spent opening connections (TCP and TLS) during the current fetch of each thread
+fetch_timing = threading.local()
+
+# Feeds currently failing: source title -> short description of the problem
+problematic_feeds = {}
+# The lxml.etree module once load_lxml has looked for it; False when lxml is not installed
+etree = None
+# requests adapter timing connection setup, defined by timed_adapter_class on first use
+timed_adapter = None
+timed_adapter_lock = threading.Lock()
+app_initialized = False # Set by init_app
+
+# Set up the application: directories, logging, the feed list and the saved state.
+# Importing the module does none of this, so tools and tests can import it cheaply
+def init_app():
+    global app_initialized, favorite_links, favorites
+    if app_initialized:
+        return
+    app_initialized = True
+    started = time.perf_counter()
+    # Ensure directories exist
+    os.makedirs(DATA_DIR, exist_ok=True)
+    os.makedirs(LOGS_DIR, exist_ok=True)
+    # Set up logging. Log file will be created in the logs directory
+    logging.basicConfig(filename=os.path.join(LOGS_DIR, 'ancap_rss.log'), level=logging.DEBUG, format='%(asctime)s %(levelname)s: %(message)s')
+    FEEDS[:] = load_custom_feeds()
+    # Load previously marked read articles
+    load_read_articles()
+    # Don't lose changes still waiting for their batched flush
+    atexit.register(flush_read_articles)
+    favorite_links = load_favorites()
+    favorites = Timeline(fav for fav in favorite_links.values() if fav is not None)
+    feed_cache.update(load_feed_cache())
+    feed_health.update(load_feed_health())
+    feed_stats.update(load_feed_stats())
+    problematic_feeds.update((record.get('title', url), f"{record.get('error_class')} (circuit open)")
+                             for url, record in feed_health.items() if record.get('state') == 'open')
+    logging.info(f"Application state loaded in {(time.perf_counter() - started) * 1000:.0f} ms.")
+
+# Work out how often a feed should be polled from its publisher hints and publish rate
+def compute_refresh_interval(hints, feed_entries):
+    hinted = 0 # Shortest interval the publisher asks for
+    try:
+        if hints.get('ttl'):
+            hinted = int(hints['ttl']) * 60 # <ttl> is expressed in minutes
+        elif hints.get('sy_updateperiod'):
+            period = SY_UPDATE_PERIODS.get(hints['sy_updateperiod'].strip().lower(), SY_UPDATE_PERIODS['daily'])
+            frequency = max(1, int(hints.get('sy_updatefrequency') or 1))
+            hinted = period // frequency
+    except (TypeError, ValueError):
+        hinted = 0 # Ignore malformed hints
+
+    # Observed rate: poll about twice per average gap between the most recent entries
+    published = sorted((entry.timestamp for entry in feed_entries if entry.timestamp), reverse=True)[:10]
+    if len(published) >= 2:
+        average_gap = (published[0] - published[-1]) / (len(published) - 1)
+        # A feed that has been silent for longer than its usual gap is slowing down
+        average_gap = max(average_gap, time.time() - published[0])
+        interval = average_gap / 2
+    else:
+        interval = DEFAULT_REFRESH_INTERVAL
+    interval = max(interval, hinted)
+    return max(MIN_REFRESH_INTERVAL, min(MAX_REFRESH_INTERVAL, interval))
+
+# Schedule the next poll of a feed; without fresh entries (not modified or failed) the interval backs off
+def schedule_next_refresh(url, hints=None, feed_entries=None):
+    with feed_schedule_lock:
+        state = feed_schedule.setdefault(url, {'interval': DEFAULT_REFRESH_INTERVAL})
+        if feed_entries is not None:
+            state['interval'] = compute_refresh_interval(hints or {}, feed_entries)
+        else:
+            state['interval'] = min(MAX_REFRESH_INTERVAL, state['interval'] * REFRESH_BACKOFF_FACTOR)
+        state['next'] = time.time() + state['interval']
+
+# Decide whether a feed may be fetched now; an open circuit only lets a probe through once its backoff expires
+def feed_circuit_allows(url):
+    with feed_health_lock:
+        record = feed_health.get(url)
+        if not record or record.get('state', 'closed') == 'closed':
+            return True
+        if record['state'] == 'open' and time.time() >= record.get('next_probe', 0):
+            record['state'] = 'half_open' # Let a single probe through
+            return True
+        return False
+
+# Record a successful fetch, closing the feed's circuit
+def record_feed_success(source_title, url):
+    with feed_health_lock:
+        record = feed_health.setdefault(url, {})
+        if record.get('state', 'closed') != 'closed':
+            logging.info(f"Feed {source_title} recovered after {record.get('consecutive_failures', 0)} failures")
+        record.update(title=source_title, state='closed', consecutive_failures=0, last_success=time.time())
+    problematic_feeds.pop(source_title, None)
+
+# Record a failed fetch, opening the circuit after repeated failures or a failed probe
+def record_feed_failure(source_title, url, error):
+    with feed_health_lock:
+        record = feed_health.setdefault(url, {})
+        failures = record.get('consecutive_failures', 0) + 1
+        record.update(title=source_title, consecutive_failures=failures, last_failure=time.time(),
+                      error_class=type(error).__name__, error=str(error))
+        if record.get('state') == 'half_open' or failures >= CIRCUIT_FAILURE_THRESHOLD:
+            backoff = CIRCUIT_BASE_BACKOFF * 2 ** max(0, failures - CIRCUIT_FAILURE_THRESHOLD)
+            record['state'] = 'open'
+            record['next_probe'] = time.time() + min(CIRCUIT_MAX_BACKOFF, backoff)
+        else:
+            record['state'] = 'closed'
+    if failures == 1:
+        # Only the first failure of a streak gets the full stack trace
+        logging.error(f"Error fetching feed for {source_title} from {url}: {error}", exc_info=error)
+    else:
+        logging.warning(f"Feed {source_title} failed again ({failures} in a row, circuit {record['state']}): {type(error).__name__}: {error}")
+    problematic_feeds[source_title] = f"{type(error).__name__}: {error}"
+
+# Parse a feed document into a compact picklable form: (channel hints, entries as plain dicts).
+# Runs in the parse worker processes, so it must only depend on its argument
+def parse_feed_content(content):
+    import feedparser
+    feed = feedparser.parse(content)
+    channel = feed.get('feed', {})
+    hints = {field: channel[field] for field in FEED_HINT_FIELDS if field in channel}
+    return hints, [compact_entry(entry) for entry in feed.entries]
+
+# Return the shared parse process pool, starting it on first use
+def get_parse_pool():
+    global parse_pool
+    with parse_pool_lock:
+        if parse_pool is None:
+            import multiprocessing
+            # 'spawn' instead of fork: forking while fetch threads hold locks (e.g., logging) can deadlock the child
+            parse_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context('spawn'))
+            # Left to garbage collection at interpreter exit, the pool's manager thread errors out on stderr
+            atexit.register(shutdown_parse_pool)
+            logging.debug(f'Started parse pool with {PARSE_WORKERS} processes.')
+        return parse_pool
+
+# Stop the parse processes, waiting for the feeds they are parsing
+def shutdown_parse_pool():
+    global parse_pool
+    with parse_pool_lock:
+        pool, parse_pool = parse_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+# Parse a downloaded feed, on the process pool when PARSE_WORKERS is set
+def parse_feed(content):
+    global parse_pool
+    if PARSE_WORKERS > 0:
+        try:
+            return get_parse_pool().submit(parse_feed_content, content).result()
+        except concurrent.futures.BrokenExecutor as e:
+            # A crashed worker breaks the pool; start a new one next time and parse this feed here
+            logging.error(f"Parse pool broken, parsing on the fetch thread: {e}", exc_info=True)
+            with parse_pool_lock:
+                parse_pool = None
+    return parse_feed_content(content)
+
+# Start profiling the current thread for an activity; None when not profiling or another profiler is active
+def start_profile(activity):
+    if profile_stats is None:
+        return None
+    import cProfile
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Python 3.12+ profiles through sys.monitoring, which takes a single profiler at a time
+        with profile_lock:
+            profile_skipped[activity] = profile_skipped.get(activity, 0) + 1
+        return None
+    return profiler
+
+# Stop a profiler from start_profile and add what it saw to the activity
+def stop_profile(profiler, activity):
+    if profiler is None:
+        return
+    profiler.disable()
+    import pstats
+    with profile_lock:
+        if activity in profile_stats:
+            profile_stats[activity].add(profiler)
+        else:
+            profile_stats[activity] = pstats.Stats(profiler)
 
-problematic_feeds = []
-
-# Function that runs in the background to load articles from feeds
-def fetch_entries_background(feed_list):
-    logging.debug('Starting fetch_entries_background.')
-    global entries_loaded, loading_done, problematic_feeds
-    all_entries = []
-    
-    def fetch_feed(session, source_title, url):
+# Call function(*args), profiled as activity when profiling
+def run_profiled(activity, function, *args):
+    profiler = start_profile(activity)
+    try:
+        return function(*args)
+    finally:
+        stop_profile(profiler, activity)
+
+# Screen wrapper for --profile: each key is profiled from the moment it is read until the next read,
+# so time spent waiting for the user is left out. The activity is the function that read the key
+class ProfiledScreen:
+    def __init__(self, window):
+        self.window = window
+        self.profiler = None
+        self.activity = None
+
+    def __getattr__(self, name):
+        return getattr(self.window, name)
+
+    def read_key(self, read):
+        stop_profile(self.profiler, self.activity)
         try:
-            logging.debug(f'Fetching feed: {source_title} from {url}')
-            response = session.get(url, timeout=5)
+            return read()
+        finally:
+            self.activity = sys._getframe(2).f_code.co_name
+            self.profiler = start_profile(self.activity)
+
+    def getch(self):
+        return self.read_key(self.window.getch)
+
+    def get_wch(self):
+        return self.read_key(self.window.get_wch)
+
+# Turn on --profile: cProfile per activity, and allocation tracing for the memory report
+def enable_profiling():
+    global profile_stats
+    import tracemalloc
+    profile_stats = {}
+    tracemalloc.start(PROFILE_TRACEMALLOC_FRAMES)
+
+# Keep a tracemalloc snapshot for the memory report when profiling
+def take_memory_snapshot(label):
+    if profile_stats is None:
+        return
+    import tracemalloc
+    if tracemalloc.is_tracing():
+        memory_snapshots.append((label, tracemalloc.take_snapshot()))
+
+# Write the profiles (one .pstats per activity plus a text summary) and the memory report to LOGS_DIR
+def write_profile_reports():
+    if profile_stats is None:
+        return
+    take_memory_snapshot('exit')
+    prefix = os.path.join(LOGS_DIR, time.strftime('profile-%Y%m%d-%H%M%S'))
+    report = io.StringIO()
+    with profile_lock:
+        for activity, stats in sorted(profile_stats.items()):
+            stats.dump_stats(f"{prefix}-{activity}.pstats")
+            report.write(f"==== {activity} ({prefix}-{activity}.pstats)\n")
+            stats.stream = report
+            stats.sort_stats('cumulative').print_stats(PROFILE_REPORT_LINES)
+        for activity, count in sorted(profile_skipped.items()):
+            report.write(f"{activity}: {count} runs not profiled while another profiler was active\n")
+    for label, snapshot in memory_snapshots:
+        report.write(f"\n==== memory: top allocations at {label}\n")
+        for statistic in snapshot.statistics('lineno')[:PROFILE_REPORT_LINES]:
+            report.write(f"{statistic}\n")
+    if len(memory_snapshots) > 1:
+        (first_label, first), (last_label, last) = memory_snapshots[0], memory_snapshots[-1]
+        report.write(f"\n==== memory: growth from {first_label} to {last_label}\n")
+        for statistic in last.compare_to(first, 'lineno')[:PROFILE_REPORT_LINES]:
+            report.write(f"{statistic}\n")
+    try:
+        with open(f"{prefix}.txt", 'w', encoding='utf-8') as f:
+            f.write(report.getvalue())
+        logging.info(f"Profile written to {prefix}.txt")
+    except Exception as e:
+        logging.error(f"Error writing profile report to {prefix}.txt: {e}", exc_info=True)
+
+# requests adapter whose connection pools time connection setup. Defined on first use, since requests and
+# urllib3 are only imported once something is fetched
+def timed_adapter_class():
+    global timed_adapter
+    with timed_adapter_lock:
+        if timed_adapter is not None:
+            return timed_adapter
+        import requests
+        import urllib3
+
+        # urllib3 connections adding the time spent connecting to the fetch of the current thread
+        # (reused keep-alive connections add nothing, which is what the timing screen should show)
+        class TimedHTTPConnection(urllib3.connection.HTTPConnection):
+            def connect(self):
+                started = time.perf_counter()
+                try:
+                    super().connect()
+                finally:
+                    fetch_timing.connect = getattr(fetch_timing, 'connect', 0.0) + time.perf_counter() - started
+
+        class TimedHTTPSConnection(urllib3.connection.HTTPSConnection):
+            def connect(self):
+                started = time.perf_counter()
+                try:
+                    super().connect()
+                finally:
+                    fetch_timing.connect = getattr(fetch_timing, 'connect', 0.0) + time.perf_counter() - started
+
+        class TimedHTTPConnectionPool(urllib3.HTTPConnectionPool):
+            ConnectionCls = TimedHTTPConnection
+
+        class TimedHTTPSConnectionPool(urllib3.HTTPSConnectionPool):
+            ConnectionCls = TimedHTTPSConnection
+
+        class TimedHTTPAdapter(requests.adapters.HTTPAdapter):
+            def init_poolmanager(self, *args, **kwargs):
+                super().init_poolmanager(*args, **kwargs)
+                self.poolmanager.pool_classes_by_scheme = {'http': TimedHTTPConnectionPool, 'https': TimedHTTPSConnectionPool}
+
+        timed_adapter = TimedHTTPAdapter
+        return timed_adapter
+
+# Session used by the fetch engines, with connection timing
+def new_fetch_session(**adapter_options):
+    import requests
+    session = requests.Session()
+    adapter = timed_adapter_class()(**adapter_options)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# Add a fetch to the timings of a feed, keeping the latest FEED_STATS_WINDOW
+def record_fetch_sample(source_title, url, sample):
+    with feed_stats_lock:
+        record = feed_stats.setdefault(url, {'samples': []})
+        record['title'] = source_title
+        record['samples'].append(sample)
+        del record['samples'][:-FEED_STATS_WINDOW]
+
+# Percentile of a list of numbers, as the value at that fraction of the sorted list (None when empty)
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+# p50/p95 of every timing of each feed, slowest feeds (by p95 of the total time) first
+def summarize_feed_stats():
+    with feed_stats_lock:
+        records = [(url, record.get('title', url), list(record.get('samples', []))) for url, record in feed_stats.items()]
+    summary = []
+    for url, title, samples in records:
+        if not samples:
+            continue
+        feed_summary = {'title': title, 'url': url, 'fetches': len(samples),
+                        'errors': sum(1 for sample in samples if sample.get('error')),
+                        'last_status': samples[-1].get('status'), 'last_entries': samples[-1].get('entries'),
+                        'last_fetch': samples[-1].get('time')}
+        for field in ('total', 'connect', 'ttfb', 'download', 'parse', 'bytes'):
+            values = [sample[field] for sample in samples if sample.get(field) is not None]
+            feed_summary[field] = {'p50': percentile(values, 0.5), 'p95': percentile(values, 0.95)}
+        summary.append(feed_summary)
+    summary.sort(key=lambda feed_summary: -(feed_summary['total']['p95'] or 0))
+    return summary
+
+# Download and parse a single feed, returning its entries tagged with the source title
+def fetch_feed(session, source_title, url):
+    if not feed_circuit_allows(url):
+        # Broken feeds don't get to spend the timeout on every fetch
+        logging.debug(f'Skipping {source_title}: circuit open')
+        schedule_next_refresh(url)
+        return []
+    # Timings of this fetch: seconds for connect, time to first byte (headers), body download, parse and the total
+    sample = {'time': time.time(), 'status': None, 'connect': None, 'ttfb': None, 'download': None,
+              'parse': None, 'total': None, 'bytes': 0, 'entries': 0, 'error': None}
+    fetch_timing.connect = 0.0
+    started = time.perf_counter()
+    try:
+        logging.debug(f'Fetching feed: {source_title} from {url}')
+        # Send the validators of the last response so unchanged feeds answer 304
+        with feed_cache_lock:
+            cached = feed_cache.get(url)
+        if cached and 'keys' not in cached:
+            cached = None # Written before the article store existed; fetch in full once
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        response = session.get(url, timeout=5, headers=headers)
+        downloaded = time.perf_counter()
+        feed_entries = None
+        if response.status_code == 304 and cached:
+            # Not modified: reuse the entries stored on the previous fetch
+            stored_entries = load_articles_by_key(cached['keys'])
+            if len(stored_entries) == len(set(cached['keys'])):
+                feed_entries = stored_entries
+                logging.debug(f'{source_title} not modified, reusing {len(feed_entries)} stored entries')
+                schedule_next_refresh(url)
+            else:
+                # The store lost some of them (e.g., the database was deleted); download in full
+                response = session.get(url, timeout=5)
+                downloaded = time.perf_counter()
+        # requests measures up to the parsed headers; the rest of the request was reading the body
+        sample.update(status=response.status_code, connect=fetch_timing.connect, ttfb=response.elapsed.total_seconds(),
+                      bytes=len(response.content))
+        sample['download'] = max(0.0, downloaded - started - sample['ttfb'])
+        if feed_entries is None:
             response.raise_for_status()
-            feed = feedparser.parse(response.content)
-            logging.debug(f'Fetched {len(feed.entries)} entries from {source_title}')
-            fetched_entries = []
-            for entry in feed.entries:
-                entry.source_title = source_title
-                fetched_entries.append(entry)
-            return fetched_entries
-        except Exception as e:
-            logging.error(f"Error fetching feed for {source_title} from {url}: {e}", exc_info=True)
-            problematic_feeds.append(f"{source_title}: {str(e)}")
-            return []
-    
+            parse_started = time.perf_counter()
+            hints, parsed_entries = parse_feed(response.content)
+            feed_entries = [Article.from_parsed(item, source_title) for item in parsed_entries]
+            sample['parse'] = time.perf_counter() - parse_started
+            logging.debug(f'Fetched {len(feed_entries)} entries from {source_title}')
+            schedule_next_refresh(url, hints, feed_entries)
+            store_articles(url, feed_entries)
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            with feed_cache_lock:
+                if etag or last_modified:
+                    feed_cache[url] = {
+                        'etag': etag,
+                        'last_modified': last_modified,
+                        'keys': [entry_key(url, entry) for entry in feed_entries],
+                    }
+                else:
+                    # Without validators the server can never answer 304
+                    feed_cache.pop(url, None)
+        record_feed_success(source_title, url)
+        sample['entries'] = len(feed_entries)
+        return feed_entries
+    except Exception as e:
+        record_feed_failure(source_title, url, e)
+        schedule_next_refresh(url)
+        sample['error'] = type(e).__name__
+        return []
+    finally:
+        sample['total'] = time.perf_counter() - started
+        record_fetch_sample(source_title, url, sample)
+
+# Fetch all feeds with a thread pool sharing one session, calling on_feed_done for each finished feed
+def fetch_feeds_threaded(feed_list, on_feed_done):
     max_workers = min(10, len(feed_list)) if feed_list else 1
-    with requests.Session() as session:
+    with new_fetch_session() as session:
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_feed = {executor.submit(fetch_feed, session, source_title, url): (source_title, url) for source_title, url in feed_list}
+            future_to_feed = {executor.submit(run_profiled, 'fetch', fetch_feed, session, source_title, url): (source_title, url)
+                              for source_title, url in feed_list}
             for future in concurrent.futures.as_completed(future_to_feed):
-                entries_from_feed = future.result()
-                all_entries.extend(entries_from_feed)
-                entries_loaded += 1
-    
-    all_entries.sort(key=lambda e: time.mktime(getattr(e, 'published_parsed', time.gmtime(0))), reverse=True)
-    for entry in all_entries:
-        if getattr(entry, 'link', None) in favorite_links:
-            favorites.append(entry)
-    favorites.sort(key=lambda e: time.mktime(getattr(e, 'published_parsed', time.gmtime(0))), reverse=True)
-    
-    entries.extend(all_entries)
-    total_entries.extend(all_entries)
+                on_feed_done(future.result())
+
+# Fetch all feeds from an asyncio event loop with a global concurrency budget and per-host limits
+async def fetch_feeds_async(feed_list, on_feed_done):
+    import asyncio
+    loop = asyncio.get_event_loop()
+    global_limit = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    host_limits = {} # Host -> semaphore limiting simultaneous requests to that host
+    sessions = {} # Host -> session, so connections to the same host are kept alive and reused
+
+    async def fetch_one(executor, source_title, url):
+        host = urlsplit(url).netloc.lower()
+        if host not in host_limits:
+            host_limits[host] = asyncio.Semaphore(MAX_FETCHES_PER_HOST)
+            sessions[host] = new_fetch_session(pool_connections=1, pool_maxsize=MAX_FETCHES_PER_HOST)
+        # Wait for a slot on the host before taking one from the global budget,
+        # so a crowded host never blocks requests to idle ones
+        async with host_limits[host]:
+            async with global_limit:
+                # requests is blocking, so the actual I/O runs on the executor threads
+                return await loop.run_in_executor(executor, run_profiled, 'fetch', fetch_feed, sessions[host], source_title, url)
+
+    max_workers = min(MAX_CONCURRENT_FETCHES, len(feed_list)) if feed_list else 1
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            tasks = [fetch_one(executor, source_title, url) for source_title, url in feed_list]
+            for next_done in asyncio.as_completed(tasks):
+                on_feed_done(await next_done)
+        finally:
+            for session in sessions.values():
+                session.close()
+
+# Identity of an entry in the article store, scoped to its feed: guids (and titles) are often only unique within one feed
+def entry_key(url, entry):
+    return f"{url}\0{entry.id or entry.link or entry.title}"
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = ('utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content', 'fbclid', 'gclid', 'ref')
+
+# Canonical form of a link, so the same story reached through different URLs is recognised
+def canonicalize_link(link):
+    parts = urlsplit(link.strip())
+    host = parts.hostname or ''
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    if host.startswith('www.'):
+        host = host[4:]
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k.lower() not in TRACKING_PARAMS])
+    path = parts.path.rstrip('/') or '/'
+    # Scheme and fragment don't identify a different story
+    return urlunsplit(('', host, path, query, ''))
+
+# Keys identifying an entry in the de-duplication index: guid within its feed and canonical link, or a content hash
+def entry_identity_keys(entry):
+    keys = []
+    if entry.id:
+        # Guids are often only unique within their feed (e.g. plain post numbers); the canonical link catches cross-posts
+        keys.append(f"id:{entry.source_title}\0{entry.id}")
+    if entry.link:
+        keys.append('link:' + canonicalize_link(entry.link))
+    if not keys:
+        content = f"{entry.source_title}\0{entry.title}\0{entry.summary}"
+        keys.append('hash:' + hashlib.sha1(content.encode('utf-8', 'replace')).hexdigest())
+    return keys
+
+# The record in index (identity key -> article) that an entry is the same story as, or None.
+# An entry with a guid is only the record with that guid in its feed, or a cross-post of a record
+# with its link from another feed: items of one feed sharing a link (e.g. every episode of a podcast
+# linking to the show page) stay apart. Entries without a guid match on any of their keys
+def find_duplicate(entry, index):
+    if entry.id:
+        record = index.get(f"id:{entry.source_title}\0{entry.id}")
+        if record is None and entry.link:
+            record = index.get('link:' + canonicalize_link(entry.link))
+            if record is not None and record.source_title == entry.source_title:
+                record = None # Another item of the same feed
+        return record
+    for key in entry_identity_keys(entry):
+        record = index.get(key)
+        if record is not None:
+            return record
+    return None
+
+# Add an entry to the de-duplication index, or find the record already there.
+# Returns (record in the timeline, True if it is new)
+def index_entry(entry):
+    existing = find_duplicate(entry, entry_index)
+    for key in entry_identity_keys(entry):
+        # A link keeps pointing at the first item seen with it; any new identity of the same story is remembered
+        entry_index.setdefault(key, existing or entry)
+    if existing is None:
+        return entry, True
+    return existing, False
+
+# Merge streams of entries (e.g., one per finished feed) into the visible timeline right away
+def merge_entries(*streams):
+    global timeline_version
+    with entries_lock:
+        # Refreshes and cross-posts bring back stories we already have; merge those into the existing records
+        added_streams = []
+        for stream in streams:
+            added = []
+            for entry in stream:
+                record, is_new = index_entry(entry)
+                if is_new:
+                    added.append(record)
+                elif record is not entry and record.source_title == entry.source_title and (record.id or None) == (entry.id or None):
+                    # An update of the same item from its own feed (cross-posts from other feeds are dropped,
+                    # and so is a guid-less item matching an item of the feed that has a guid)
+                    if record.timestamp != entry.timestamp or record.link != entry.link:
+                        # A new publication date moves the record (and a new link may change its read state):
+                        # take it out before its sort key and counters change
+                        for timeline in (entries, total_entries, favorites, *unread_views(record)):
+                            timeline.discard(record)
+                        if record.source_title in entries_by_feed:
+                            entries_by_feed[record.source_title].discard(record)
+                        added.append(record)
+                    for field in ('link', 'title', 'timestamp', 'date_text', 'datetime_text', 'summary'):
+                        setattr(record, field, getattr(entry, field))
+            added_streams.append(added)
+        if not any(added_streams):
+            return # Updated records changed in place
+        entries.merge(added_streams)
+        total_entries.merge(added_streams)
+        new_records = [record for added in added_streams for record in added]
+        index_views(new_records)
+        index_views([record for record in new_records if not is_read(record)], unread_only=True)
+        # A favorite coming back from a feed replaces its snapshot, so both views share one record
+        added_favorites = []
+        resolved_favorites = False
+        for added in added_streams:
+            for entry in added:
+                if entry.link in favorite_links:
+                    snapshot = favorite_links[entry.link]
+                    if snapshot is None:
+                        resolved_favorites = True # Saved by an older version as a bare link
+                    elif snapshot is not entry:
+                        favorites.discard(snapshot)
+                    favorite_links[entry.link] = entry
+                    added_favorites.append(entry)
+        favorites.merge([added_favorites])
+        timeline_version += 1
+    if resolved_favorites:
+        save_favorites()
+
+# Find where the cursor belongs after the timeline changed: follow the entry that was
+# drawn at entry_idx, keeping any movement (idx - entry_idx) made since it was drawn
+def relocate_cursor(timeline, entry, entry_idx, idx):
+    pos = timeline.index_of(entry)
+    if pos >= 0:
+        idx = pos + idx - entry_idx
+    return max(0, min(idx, len(timeline) - 1))
+
+# Timelines whose counters follow read changes, each once: a list on screen can also be one of
+# the others (favorites_mode shows favorites itself), and counting it twice would skew its counters
+def counted_timelines(feed_timelines):
+    timelines = {}
+    for timeline in (entries, total_entries, favorites, *feed_timelines, *open_views):
+        if timeline is not None:
+            timelines[id(timeline)] = timeline
+    return timelines.values()
+
+# Keep the counters of every timeline holding the article in step with its new read state
+def update_read_stats(article):
+    now_read = is_read(article)
+    with entries_lock:
+        for timeline in counted_timelines([entries_by_feed.get(article.source_title)]):
+            if article in timeline:
+                timeline.stats.read_changed(article, now_read)
+
+# Recount every timeline, and rebuild the unread views, after a read-state change covering whole feeds
+def recount_read_stats():
+    global timeline_version
+    with entries_lock:
+        for timeline in counted_timelines(entries_by_feed.values()):
+            timeline.stats.recount(timeline)
+        unread_entries.clear()
+        for timeline in unread_by_feed.values():
+            timeline.clear()
+        index_views([article for article in entries if not is_read(article)], unread_only=True)
+        timeline_version += 1
+
+# A timeline for one of the filtered views of entries
+def new_view_timeline():
+    timeline = Timeline()
+    timeline.whole_feeds = True
+    return timeline
+
+# Add articles of the timeline to the per-feed views, or to the unread views
+def index_views(articles, unread_only=False):
+    by_feed = {}
+    for article in articles:
+        by_feed.setdefault(article.source_title, []).append(article)
+    views = unread_by_feed if unread_only else entries_by_feed
+    for feed, feed_articles in by_feed.items():
+        if feed not in views:
+            views[feed] = new_view_timeline()
+        views[feed].merge([feed_articles])
+    if unread_only:
+        unread_entries.merge(by_feed.values())
+
+# Unread views an article belongs to while it is unread
+def unread_views(article):
+    return unread_entries, view_timeline(article.source_title, unread_only=True)
+
+# The view of entries for a feed (None for all of them), optionally only its unread articles.
+# Views are kept up to date as articles arrive and change state, so switching costs nothing
+def view_timeline(source=None, unread_only=False):
+    if source is None:
+        return unread_entries if unread_only else entries
+    views = unread_by_feed if unread_only else entries_by_feed
+    if source not in views:
+        views[source] = new_view_timeline()
+    return views[source]
+
+# The record in the timeline for an article loaded again from the store, if there is one
+def find_entry(article):
+    return find_duplicate(article, entry_index)
+
+# Search the archive and return the matches within scope (the timeline or favorites), best first
+def search_articles(text, scope):
+    found = find_stored_articles(text)
+    if scope is favorites:
+        records = [favorite_links.get(article.link) for article in found]
+    else:
+        # Matches older than what has been paged in join the timeline; known ones resolve to their records
+        merge_entries(found)
+        with entries_lock:
+            records = [find_entry(article) for article in found]
+    return SearchResults([record for record in records if record is not None])
+
+# Add or remove an article from favorites
+def toggle_favorite(article):
+    global timeline_version
+    link_to_toggle = getattr(article, 'link', None)
+    with entries_lock:
+        if link_to_toggle in favorite_links: # If already favorite, remove it
+            snapshot = favorite_links.pop(link_to_toggle)
+            if snapshot is not None:
+                favorites.discard(snapshot)
+        else: # If not favorite, add it
+            favorites.add(article)
+            favorite_links[link_to_toggle] = article
+        timeline_version += 1
+    save_favorites() # Save favorites
+
+# Fetch feeds with the configured FETCH_ENGINE, calling on_feed_done with the entries of each finished feed.
+# Used by the initial load and the background refresh alike
+def fetch_feeds(feed_list, on_feed_done):
+    if FETCH_ENGINE == 'asyncio':
+        import asyncio
+        asyncio.run(fetch_feeds_async(feed_list, on_feed_done))
+    else:
+        fetch_feeds_threaded(feed_list, on_feed_done)
+
+# Function that runs in the background to load articles from feeds
+# (publish receives the entries of each feed; batch mode streams them out instead of building the timeline)
+def fetch_entries_background(feed_list, publish=merge_entries):
+    logging.debug(f'Starting fetch_entries_background with the {FETCH_ENGINE} engine.')
+    global loading_done
+
+    def on_feed_done(entries_from_feed):
+        global entries_loaded
+        # Publish each feed as soon as it finishes instead of waiting for the slowest one
+        run_profiled('merge', publish, entries_from_feed)
+        entries_loaded += 1
+
+    started = time.time()
+    fetch_feeds(feed_list, on_feed_done)
+    save_feed_cache()
+    save_feed_health()
+    save_feed_stats()
+    take_memory_snapshot('after ingestion')
     loading_done = True
-    logging.debug(f'fetch_entries_background completed. Total feeds processed: {entries_loaded}, total entries fetched: {len(all_entries)}')
-    logging.debug(f'Total entries added to global list: {len(entries)}')
+    # Every feed that answered is in the timeline now, so links of those feeds missing from it are no longer served
+    with feed_health_lock:
+        fetched_feeds = {record.get('title') for record in feed_health.values() if record.get('last_success', 0) >= started}
+    if publish is merge_entries and prune_read_history(fetched_feeds):
+        compact_read_articles()
+    logging.debug(f'fetch_entries_background completed. Total feeds processed: {entries_loaded}, total entries: {len(total_entries)}')
+
+# Background scheduler that re-polls each feed when its own interval is due
+def refresh_feeds_background(feed_list):
+    # Wait for the initial load, which also sets the first schedule of every feed
+    while not loading_done:
+        time.sleep(REFRESH_CHECK_INTERVAL / 10)
+    logging.debug('Starting refresh_feeds_background.')
+    while True:
+        time.sleep(REFRESH_CHECK_INTERVAL)
+        now = time.time()
+        with feed_schedule_lock:
+            due = [(feed_schedule.get(url, {}).get('next', 0), source_title, url) for source_title, url in feed_list]
+        # Most overdue first, and never more than the per-check cap
+        due = [(source_title, url) for next_refresh, source_title, url in sorted(due) if next_refresh <= now]
+        due = due[:MAX_REFRESHES_PER_CHECK]
+        if not due:
+            continue
+        logging.debug(f'Refreshing {len(due)} due feeds.')
+        # Merge the refreshed feeds together at the end, in a single k-way merge
+        refreshed_streams = []
+        fetch_feeds(due, refreshed_streams.append)
+        merge_entries(*refreshed_streams)
+        save_feed_cache()
+        save_feed_health()
+        save_feed_stats()
 
 # Add text to screen safely (without breaking curses)
 def safe_addstr(stdscr, y, x, text, attr=0):
@@ -185,19 +1667,19 @@ def safe_addstr(stdscr, y, x, text, attr=0):
 
 # Draw a line with the summary of each RSS entry
 def draw_entry(stdscr, y, entry, selected=False, content_width=0, left_margin=2, right_margin=2):
-    date = time.strftime('%d/%m/%Y', getattr(entry, 'published_parsed', time.gmtime(0)))
-    source = f"[{getattr(entry, 'source_title', _('UNKNOWN')).lower()}]"
-    title = html.unescape(getattr(entry, 'title', _('No Title')))
-    link = getattr(entry, 'link', None)
+    date = entry.date_text
+    source = f"[{(entry.source_title or _('UNKNOWN')).lower()}]"
+    title = entry.title
+    link = entry.link
 
     max_y, max_x = stdscr.getmaxyx()
     effective_max_x = content_width if content_width > 0 else (max_x - left_margin - right_margin)
 
-    is_read = link in read_articles
+    read = is_read(entry)
     is_favorite = link in favorite_links
     if selected:
         attr = curses.color_pair(6)  # White for selected line
-    elif is_read:
+    elif read:
         attr = curses.color_pair(8)  # Gray for read articles
     else:
         attr = curses.color_pair(2)  # Yellow for unread articles
@@ -223,8 +1705,14 @@ def draw_entry(stdscr, y, entry, selected=False, content_width=0, left_margin=2,
     safe_addstr(stdscr, y, x_offset, title, attr)
 
 
-# Clean HTML and present content in a readable way
-def format_html_content(raw_html, text_width):
+# Open an article's link in the web browser. webbrowser is imported here, as it probes for browsers on import
+def open_in_browser(article):
+    import webbrowser
+    webbrowser.open(getattr(article, 'link', ''))
+
+# Text, image sources and link targets of an HTML summary, using BeautifulSoup
+def html_to_text_bs4(raw_html):
+    from bs4 import BeautifulSoup
     # Remove script and style tags to avoid unwanted content
     soup = BeautifulSoup(raw_html, 'html.parser')
     for script_or_style in soup(["script", "style"]):
@@ -242,6 +1730,67 @@ def format_html_content(raw_html, text_width):
     # Get text without style attributes
     # Use space as separator, and strip to clean extra whitespace
     text = soup.get_text(separator=' ', strip=True)
+
+    images = [img.get('src') for img in soup.find_all(
+        'img') if img.get('src')]
+    links = [a.get('href') for a in soup.find_all(
+        'a') if a.get('href')]
+    return text, images, links
+
+# Same result as html_to_text_bs4 in a single pass over the tree built by lxml's C parser:
+# every text node stripped and joined with spaces (script, style and comments left out),
+# plus the image sources and link targets in document order
+def html_to_text_lxml(raw_html):
+    etree = load_lxml()
+    strings, images, links = [], [], []
+    root = etree.fromstring(raw_html, etree.HTMLParser()) if raw_html.strip() else None
+    if root is not None:
+        walker = etree.iterwalk(root, events=('start', 'end', 'comment', 'pi'))
+        for event, element in walker:
+            if event == 'start':
+                if element.tag in ('script', 'style'):
+                    walker.skip_subtree() # Its 'end' still comes, for the text that follows it
+                    continue
+                if element.text:
+                    strings.append(element.text)
+                if element.tag == 'img' and element.get('src'):
+                    images.append(element.get('src'))
+                elif element.tag == 'a' and element.get('href'):
+                    links.append(element.get('href'))
+            elif element.tail: # Text after an element, comment or processing instruction
+                strings.append(element.tail)
+    text = ' '.join(stripped for stripped in (string.strip() for string in strings) if stripped)
+    return text, images, links
+
+# Import lxml's etree on first use; returns the module, or False when lxml is not installed
+def load_lxml():
+    global etree
+    if etree is None:
+        try:
+            from lxml import etree as lxml_etree # Fast HTML-to-text engine; BeautifulSoup is used without it
+            etree = lxml_etree
+        except ImportError:
+            etree = False
+    return etree
+
+# Text, image sources and link targets of an HTML summary, with the configured engine
+def html_to_text(raw_html):
+    if HTML_ENGINE == 'lxml' and load_lxml():
+        try:
+            return html_to_text_lxml(raw_html)
+        except Exception as e: # e.g. input lxml refuses; BeautifulSoup copes with anything
+            logging.debug(f"lxml could not render an article, using BeautifulSoup: {e}")
+    return html_to_text_bs4(raw_html)
+
+# textwrap.fill, skipping the wrapping machinery for the common case of a line that already fits
+def fill_line(line, width, subsequent_indent=""):
+    if len(line) <= width and line.isprintable() and line.strip() == line:
+        return line # What textwrap would return
+    return textwrap.fill(line, width=width, subsequent_indent=subsequent_indent)
+
+# Clean HTML and present content in a readable way
+def format_html_content(raw_html, text_width):
+    text, images, links = html_to_text(raw_html)
     
     # Replace multiple line breaks with a maximum of two (for paragraphs)
     # This will convert 3 or more \n into 2 \n (which will appear as a separate paragraph)
@@ -272,21 +1821,17 @@ def format_html_content(raw_html, text_width):
     else:
         parts.append((_("no content available."), curses.color_pair(6)))
 
-    images = [img.get('src') for img in soup.find_all(
-        'img') if img.get('src')]
     if images:
         parts.append(("", curses.color_pair(6)))
         for i, url in enumerate(images):
-            wrapped_url = textwrap.fill(
+            wrapped_url = fill_line(
                 f"{i+1}. {url}", width=dynamic_content_width, subsequent_indent="  ")
             parts.extend([(line, curses.color_pair(6)) for line in wrapped_url.split('\n')])
 
-    links = [a.get('href') for a in soup.find_all(
-        'a') if a.get('href')]
     if links:
         parts.append(("", curses.color_pair(6)))
         for i, url in enumerate(links):
-            wrapped_url = textwrap.fill(
+            wrapped_url = fill_line(
                 f"{i+1}. {url}", width=dynamic_content_width, subsequent_indent="  ")
             parts.extend([(line, curses.color_pair(6)) for line in wrapped_url.split('\n')])
 
@@ -294,111 +1839,212 @@ def format_html_content(raw_html, text_width):
     return parts, dynamic_content_width
 
 
-# Draw the loaded articles screen
-def draw_feed(stdscr, entries, idx):
-    stdscr.clear()
+# Formatted body of an article at a given width, parsed only the first time it is needed
+def get_formatted_content(article, text_width):
+    global format_cache_width
+    key = (article, text_width)
+    summary = article.summary
+    with format_cache_lock:
+        if text_width != format_cache_width:
+            format_cache.clear() # The terminal was resized: every cached wrap is stale
+            format_cache_width = text_width
+        cached = format_cache.get(key)
+        if cached is not None and cached[0] is summary: # Records updated in place get a new summary
+            format_cache.move_to_end(key)
+            return cached[1]
+    formatted = format_html_content(summary, text_width)
+    with format_cache_lock:
+        if text_width == format_cache_width:
+            format_cache[key] = (summary, formatted)
+            format_cache.move_to_end(key)
+            while len(format_cache) > FORMAT_CACHE_SIZE:
+                format_cache.popitem(last=False)
+    return formatted
+
+# Have the background worker format the neighbours of the article being read, so j/k finds them ready
+def prerender_neighbours(timeline, idx, text_width):
+    global prerender_request, prerender_thread
+    with prerender_condition:
+        prerender_request = (timeline, idx, text_width)
+        if prerender_thread is None:
+            prerender_thread = threading.Thread(target=prerender_worker, daemon=True)
+            prerender_thread.start()
+        prerender_condition.notify()
+
+# Background worker formatting the articles around the reader, nearest first (j/k wrap around the list)
+def prerender_worker():
+    global prerender_request
+    while True:
+        with prerender_condition:
+            while prerender_request is None:
+                prerender_condition.wait()
+            timeline, idx, text_width = prerender_request
+            prerender_request = None
+        for distance in range(1, PRERENDER_NEIGHBOURS + 1):
+            for offset in (distance, -distance):
+                if prerender_request is not None:
+                    break # The reader moved on: start over around the new article
+                with entries_lock:
+                    article = timeline[(idx + offset) % len(timeline)] if timeline else None
+                if article is None:
+                    continue
+                try:
+                    get_formatted_content(article, text_width)
+                except Exception as e:
+                    logging.error(f"Error pre-rendering article {article.link}: {e}", exc_info=True)
+
+# The article list screen, split into header, list and footer windows. Each window remembers what
+# it last drew and only rewrites the rows whose content changed, and all of them reach the terminal
+# in a single doupdate, so moving the cursor sends two rows instead of the whole screen
+class FeedView:
     LEFT_MARGIN = 2
     RIGHT_MARGIN = 2
-    max_y, max_x = stdscr.getmaxyx()
-    content_max_x = max_x - LEFT_MARGIN - RIGHT_MARGIN
-
-    # Prominent ANCAP header with more readable ASCII art
-    ancap_line1 = "▄▀█ █▄ █ █▀▀ ▄▀█ █▀█"
-    ancap_line2 = "█▀█ █ ▀█ █▄▄ █▀█ █▀▀"
-    subtitle = "» A LIBERTARIAN RSS READER «"
-    
-    # Center and display the ASCII logo
-    safe_addstr(stdscr, HEADER_TOP_PADDING, LEFT_MARGIN + max(0, (content_max_x - len(ancap_line1)) // 2), ancap_line1, curses.color_pair(2))
-    safe_addstr(stdscr, HEADER_TOP_PADDING + 1, LEFT_MARGIN + max(0, (content_max_x - len(ancap_line2)) // 2), ancap_line2, curses.color_pair(2))
-    safe_addstr(stdscr, HEADER_TOP_PADDING + 2, LEFT_MARGIN + max(0, (content_max_x - len(subtitle)) // 2), subtitle, curses.color_pair(6))
-    
-    # Line 1: Main statistics (centered)
-    unread_count = len([e for e in entries if getattr(e, 'link', None) not in read_articles])
-    total_count = len(entries)
-    feeds_count = len(FEEDS)
-    
-    stats_line = f"ARTICLES: {total_count} | UNREAD: {unread_count} | FEEDS: {feeds_count}"
-    if favorites:
-        stats_line += f" | FAVORITES: {len(favorites)}"
-    
-    stats_y = HEADER_TOP_PADDING + 4  # Adjust for the new more compact header
-    stats_x = LEFT_MARGIN + max(0, (content_max_x - len(stats_line)) // 2)
-    safe_addstr(stdscr, stats_y, stats_x, stats_line, curses.color_pair(2))
-    
-    # Line 2: Status and date/time (aligned to extremes)
-    status_y = HEADER_TOP_PADDING + 5  # Adjust for the new more compact header
-    
-    # System status (left)
-    status_parts = []
-    if problematic_feeds:
-        status_parts.append(f"⚠ {len(problematic_feeds)} feeds with issues")
-    if loading_done:
-        status_parts.append("✓ UPDATED")
-    else:
-        status_parts.append("⟳ updating...")
-    
-    status_text = " | ".join(status_parts)
-    
-    # Show status with different colors
-    if loading_done:
-        safe_addstr(stdscr, status_y, LEFT_MARGIN, status_text, curses.color_pair(2))  # Yellow for updated
-    else:
-        safe_addstr(stdscr, status_y, LEFT_MARGIN, status_text, curses.color_pair(7))  # Gray for updating
-    
-    # Date and time (right)
-    current_time = time.strftime('%H:%M:%S')
-    current_date = time.strftime('%d/%m/%Y')
-    datetime_text = f"{current_date} {current_time}"
-    datetime_x = LEFT_MARGIN + content_max_x - len(datetime_text)
-    safe_addstr(stdscr, status_y, datetime_x, datetime_text, curses.color_pair(2))
-
-    # Blank line for separation
-    blank_y = status_y + 1
-    safe_addstr(stdscr, blank_y, LEFT_MARGIN, " " * content_max_x, curses.color_pair(2))
-
-    # Calculate available area for articles
-    header_height = status_y + 2  # Adjusted complete header height
-    footer_height = 3  # Space reserved for shortcuts in the footer
-    display_height = max_y - header_height - footer_height
-    start_display_row = header_height
-
-    if len(entries) > display_height:
-        start = max(0, idx - display_height // 2)
-        start = min(start, len(entries) - display_height)
-    else:
-        start = 0
-
-    end = min(len(entries), start + display_height)
-
-    for i, entry in enumerate(entries[start:end], start=start):
-        draw_entry(stdscr, start_display_row + i - start, entry,
-                   selected=(i == idx), content_width=content_max_x, left_margin=LEFT_MARGIN, right_margin=RIGHT_MARGIN)
-
-    # Shortcuts at the bottom (footer) - single line
-    footer_y = max_y - 2
-    
-    # Yellow separator line
-    separator = "─" * content_max_x
-    safe_addstr(stdscr, footer_y, LEFT_MARGIN, separator, curses.color_pair(2))
-    
-    # All shortcuts on a single line (all yellow)
-    shortcuts_text = "j/k=nav SPACE=read o=open f=fav l=save u=unread m=mark all q/ESC=exit PgUp/PgDn=scroll"
-    
-    # Center the shortcuts
-    start_x = LEFT_MARGIN + max(0, (content_max_x - len(shortcuts_text)) // 2)
-    safe_addstr(stdscr, footer_y + 1, start_x, shortcuts_text, curses.color_pair(2))
-
-    stdscr.refresh()
+    FOOTER_HEIGHT = 3 # Blank line, separator and shortcuts
+
+    def __init__(self, stdscr):
+        self.size = stdscr.getmaxyx()
+        max_y, max_x = self.size
+        self.content_max_x = max_x - self.LEFT_MARGIN - self.RIGHT_MARGIN
+        # Logo, blank line, statistics, status and a blank line for separation
+        self.list_y = min(max_y, HEADER_TOP_PADDING + 7)
+        self.list_height = max(0, max_y - self.list_y - self.FOOTER_HEIGHT)
+        footer_y = self.list_y + self.list_height
+        # A new layout starts from a fully repainted screen. stdscr is left blank and refreshed so
+        # that getch, which refreshes stdscr, never paints it over the windows
+        stdscr.clear()
+        stdscr.noutrefresh()
+        # newwin treats a height of 0 as "up to the bottom of the screen", so tiny terminals get no window
+        self.header = curses.newwin(self.list_y, max_x, 0, 0) if self.list_y else None
+        self.list = curses.newwin(self.list_height, max_x, self.list_y, 0) if self.list_height else None
+        self.footer = curses.newwin(max_y - footer_y, max_x, footer_y, 0) if max_y > footer_y else None
+        if self.list:
+            self.list.idlok(True) # Let curses scroll the terminal instead of resending every row
+        self.header_lines = {} # Header row -> parts last drawn on it
+        self.rows = [None] * self.list_height # What was last drawn on each list row
+        self.start = 0 # Timeline index shown on the first list row
+        self.draw_static()
+
+    # Logo and footer never change for a given terminal size
+    def draw_static(self):
+        content_max_x = self.content_max_x
+        if self.header:
+            # Prominent ANCAP header with more readable ASCII art
+            ancap_line1 = "▄▀█ █▄ █ █▀▀ ▄▀█ █▀█"
+            ancap_line2 = "█▀█ █ ▀█ █▄▄ █▀█ █▀▀"
+            subtitle = "» A LIBERTARIAN RSS READER «"
+            safe_addstr(self.header, HEADER_TOP_PADDING, self.LEFT_MARGIN + max(0, (content_max_x - len(ancap_line1)) // 2), ancap_line1, curses.color_pair(2))
+            safe_addstr(self.header, HEADER_TOP_PADDING + 1, self.LEFT_MARGIN + max(0, (content_max_x - len(ancap_line2)) // 2), ancap_line2, curses.color_pair(2))
+            safe_addstr(self.header, HEADER_TOP_PADDING + 2, self.LEFT_MARGIN + max(0, (content_max_x - len(subtitle)) // 2), subtitle, curses.color_pair(6))
+        if self.footer:
+            # Shortcuts at the bottom (footer) - single line, under a yellow separator
+            footer_y = self.footer.getmaxyx()[0] - 2
+            safe_addstr(self.footer, footer_y, self.LEFT_MARGIN, "─" * content_max_x, curses.color_pair(2))
+            shortcuts_text = "j/k=nav SPACE=read o=open f=fav l=save u=unread m=all n/U=next/only unread p=feed /=search h=health i=timing q=exit"
+            safe_addstr(self.footer, footer_y + 1, self.LEFT_MARGIN + max(0, (content_max_x - len(shortcuts_text)) // 2), shortcuts_text, curses.color_pair(2))
+
+    # Another screen drew over the terminal: send every window again on the next update
+    def invalidate(self):
+        for window in (self.header, self.list, self.footer):
+            if window:
+                window.touchwin()
+
+    # Rewrite a header row if its parts, a list of (x, text, attr), changed
+    def set_header_line(self, y, parts):
+        if y >= self.list_y or self.header_lines.get(y) == parts:
+            return
+        self.header.move(y, 0)
+        self.header.clrtoeol()
+        for x, text, attr in parts:
+            safe_addstr(self.header, y, x, text, attr)
+        self.header_lines[y] = parts
+
+    def draw_header(self, timeline, label=None):
+        # Line 1: Main statistics (centered), from the counters kept by the timeline, after the name of the view
+        stats_line = f"ARTICLES: {len(timeline)} | UNREAD: {timeline.stats.unread} | FEEDS: {len(FEEDS)}"
+        if label:
+            stats_line = f"{label} | {stats_line}"
+        if favorites:
+            stats_line += f" | FAVORITES: {len(favorites)}"
+        stats_x = self.LEFT_MARGIN + max(0, (self.content_max_x - len(stats_line)) // 2)
+        self.set_header_line(HEADER_TOP_PADDING + 4, [(stats_x, stats_line, curses.color_pair(2))])
+
+        # Line 2: System status (left, yellow when updated and gray while updating) and date/time (right)
+        status_parts = []
+        if problematic_feeds:
+            status_parts.append(f"⚠ {len(problematic_feeds)} feeds with issues")
+        if loading_done:
+            status_parts.append("✓ UPDATED")
+        else:
+            status_parts.append(f"⟳ updating... {entries_loaded}/{len(FEEDS)}")
+        status_attr = curses.color_pair(2) if loading_done else curses.color_pair(7)
+        datetime_text = time.strftime('%d/%m/%Y %H:%M:%S')
+        datetime_x = self.LEFT_MARGIN + self.content_max_x - len(datetime_text)
+        self.set_header_line(HEADER_TOP_PADDING + 5, [(self.LEFT_MARGIN, " | ".join(status_parts), status_attr),
+                                                      (datetime_x, datetime_text, curses.color_pair(2))])
+
+    def draw_rows(self, timeline, idx):
+        display_height = self.list_height
+        if len(timeline) > display_height:
+            start = max(0, idx - display_height // 2)
+            start = min(start, len(timeline) - display_height)
+        else:
+            start = 0
+        self.start = start
+        for row in range(display_height):
+            i = start + row
+            if i < len(timeline):
+                entry = timeline[i]
+                # Everything draw_entry shows; records are updated in place, so their fields are part of it
+                drawn = (entry, entry.title, entry.date_text, entry.source_title,
+                         i == idx, is_read(entry), entry.link in favorite_links)
+            else:
+                entry, drawn = None, None
+            if drawn == self.rows[row]:
+                continue
+            self.list.move(row, 0)
+            self.list.clrtoeol()
+            if entry is not None:
+                draw_entry(self.list, row, entry, selected=(i == idx), content_width=self.content_max_x,
+                           left_margin=self.LEFT_MARGIN, right_margin=self.RIGHT_MARGIN)
+            self.rows[row] = drawn
+
+    # Timeline index of the entry shown at screen row y, or None
+    def entry_at(self, y, count):
+        row = y - self.list_y
+        if 0 <= row < self.list_height and self.start + row < count:
+            return self.start + row
+        return None
+
+    def draw(self, timeline, idx, label=None):
+        if self.header:
+            self.draw_header(timeline, label)
+        if self.list:
+            self.draw_rows(timeline, idx)
+        for window in (self.header, self.list, self.footer):
+            if window:
+                window.noutrefresh()
+        curses.doupdate()
+
+# Start drawing a screen other than the article list on stdscr. Erasing (rather than clearing)
+# lets curses send only the cells that differ from what the terminal already shows
+def begin_full_screen(stdscr):
+    stdscr.erase()
+    if feed_view is not None:
+        feed_view.invalidate()
+
+# Draw the loaded articles screen, creating its windows on first use and when the terminal is resized
+def draw_feed(stdscr, entries, idx, label=None):
+    global feed_view
+    if feed_view is None or feed_view.size != stdscr.getmaxyx():
+        feed_view = FeedView(stdscr)
+    feed_view.draw(entries, idx, label)
 
 # Display the content of a selected article
 def read_article(stdscr, current_entries_list, initial_idx):
-    current_idx = initial_idx # Maintain a local index for J/K navigation
+    entry = current_entries_list[initial_idx] # Navigation follows the article shown, not an index
 
     # Mark the current article as read when entering reading mode
-    current_link = getattr(current_entries_list[current_idx], 'link', None)
-    if current_link:
-        read_articles.add(current_link)
-        save_read_articles()
+    mark_read(entry)
 
     current_line_offset = 0 # Offset for content line scrolling
     # We remove link navigation: j/k only change articles
@@ -407,11 +2053,13 @@ def read_article(stdscr, current_entries_list, initial_idx):
     RIGHT_MARGIN = 20
 
     while True: # Loop for reading mode (allows J/K navigation)
-        # Get the current article according to the index
-        entry = current_entries_list[current_idx]
+        # Find the article in the list: feeds merged in the background may have shifted it, and it stays
+        # on screen even after leaving the list (read in the unread view, removed from favorites)
+        with entries_lock:
+            current_idx = current_entries_list.locate(entry)[0]
 
         max_y, max_x = stdscr.getmaxyx() # Get window dimensions
-        stdscr.clear() # Clear the screen
+        begin_full_screen(stdscr) # Redrawn in full, but curses only sends the cells that changed
         
         # Calculate content area width
         content_max_x = max_x - LEFT_MARGIN - RIGHT_MARGIN
@@ -427,25 +2075,12 @@ def read_article(stdscr, current_entries_list, initial_idx):
         safe_addstr(stdscr, HEADER_TOP_PADDING + 2, LEFT_MARGIN + max(0, (content_max_x - len(subtitle)) // 2), subtitle, curses.color_pair(6))
 
         # Article title (unescaped and translatable)
-        title = html.unescape(getattr(entry, 'title', _('No Title')))
-        # Use published_parsed for local date/time formatting if available
-        published_parsed = getattr(entry, 'published_parsed', None)
-        if published_parsed:
-            date = time.strftime('%d/%m/%Y %H:%M', published_parsed)
-        else:
-            date = html.unescape(getattr(entry, 'published', getattr(entry, 'updated', _('No Date'))))
-        raw_content = getattr(entry, 'summary', _('No content available'))
+        title = entry.title
 
-        # Responsive width for content
+        # Responsive width for content; the links are already listed at the end of the formatted content
         content_text_width_for_func = content_max_x
-        formatted_content_parts, actual_content_width = format_html_content(raw_content, content_text_width_for_func)
-        # Find all links in the article content
-        soup = BeautifulSoup(raw_content, 'html.parser')
-        links = [a.get('href') for a in soup.find_all('a') if a.get('href')]
-
-
-
-
+        formatted_content_parts, actual_content_width = get_formatted_content(entry, content_text_width_for_func)
+        prerender_neighbours(current_entries_list, current_idx, content_text_width_for_func)
 
         # Move title to sources position, in white and separated from text by an empty line
         # Calculate available width for title leaving space for SAVED
@@ -472,7 +2107,7 @@ def read_article(stdscr, current_entries_list, initial_idx):
         safe_addstr(stdscr, blank_line_y, LEFT_MARGIN, "", curses.color_pair(2))
 
         # Show sources in yellow, lowercase and in brackets
-        source = f"[{getattr(entry, 'source_title', _('UNKNOWN')).lower()}]"
+        source = f"[{(entry.source_title or _('UNKNOWN')).lower()}]"
         source_attr = curses.color_pair(2)  # Yellow
         source_y = blank_line_y + 1
         
@@ -510,74 +2145,44 @@ def read_article(stdscr, current_entries_list, initial_idx):
         key = stdscr.getch()
 
         if key == ord(' '):
-            return current_idx
+            with entries_lock: # Back on the list at the article, or where it was
+                return max(0, min(current_entries_list.locate(entry)[0], len(current_entries_list) - 1))
         elif key == ord('o'):
-            webbrowser.open(getattr(entry, 'link', ''))
+            open_in_browser(entry)
         elif key == ord('t') or key == ord('T'):
             pass
         elif key == ord('u'):
-            link_to_unmark = getattr(current_entries_list[current_idx], 'link', None)
-            if link_to_unmark in read_articles:
-                read_articles.remove(link_to_unmark)
-                save_read_articles()
-            stdscr.clear()
+            mark_unread(entry)
             continue
         elif key == ord('m'): # 'm' to toggle mark all as read/unread
             # Count read and unread articles
-            read_count = sum(1 for entry in current_entries_list if getattr(entry, 'link', None) in read_articles)
-            unread_count = len(current_entries_list) - read_count
+            unread_count = current_entries_list.stats.unread
+            read_count = len(current_entries_list) - unread_count
             
             # If there are more unread than read, mark all as read
             # If there are more read than unread, mark all as unread
             if unread_count >= read_count:
-                # Mark all as read
-                for entry in current_entries_list:
-                    entry_link = getattr(entry, 'link', None)
-                    if entry_link:
-                        read_articles.add(entry_link)
+                # Mark all as read (one watermark per feed when the list holds whole feeds)
+                mark_all_read(current_entries_list)
             else:
                 # Mark all as unread
-                for entry in current_entries_list:
-                    entry_link = getattr(entry, 'link', None)
-                    if entry_link and entry_link in read_articles:
-                        read_articles.remove(entry_link)
-            save_read_articles()
-            stdscr.clear()
+                mark_all_unread(current_entries_list)
             continue
         elif key in [ord('s'), ord('l')]: # 's' or 'l' to save/mark as favorite (toggle)
-            article = current_entries_list[current_idx]
-            link_to_toggle = getattr(article, 'link', None)
-            if link_to_toggle in favorite_links: # If already favorite, remove it
-                favorites[:] = [fav for fav in favorites if getattr(fav, 'link', None) != link_to_toggle]
-                favorite_links.remove(link_to_toggle)
-            else: # If not favorite, add it
-                favorites.append(article)
-                favorite_links.add(link_to_toggle)
-            # Re-sort favorites list after adding/removing
-            favorites.sort(key=lambda e: time.mktime(getattr(e, 'published_parsed', time.gmtime(0))), reverse=True)
-            save_favorites() # Save favorites
-        elif key == ord('j') or key == curses.KEY_DOWN:
-            if current_idx < len(current_entries_list) - 1:
-                current_idx += 1
-                current_line_offset = 0
-                read_articles.add(getattr(current_entries_list[current_idx], 'link', None))
-                save_read_articles()
-            else:
-                current_idx = 0
-                current_line_offset = 0
-                read_articles.add(getattr(current_entries_list[current_idx], 'link', None))
-                save_read_articles()
-        elif key == ord('k') or key == curses.KEY_UP:
-            if current_idx > 0:
-                current_idx -= 1
-                current_line_offset = 0
-                read_articles.add(getattr(current_entries_list[current_idx], 'link', None))
-                save_read_articles()
-            else:
-                current_idx = len(current_entries_list) - 1
-                current_line_offset = 0
-                read_articles.add(getattr(current_entries_list[current_idx], 'link', None))
-                save_read_articles()
+            toggle_favorite(entry)
+        elif key in (ord('j'), curses.KEY_DOWN, ord('k'), curses.KEY_UP):
+            with entries_lock:
+                if not current_entries_list:
+                    continue
+                # Next or previous article, wrapping around; for an article no longer listed the next one took its place
+                current_idx, in_list = current_entries_list.locate(entry)
+                if key in (ord('j'), curses.KEY_DOWN):
+                    current_idx = current_idx + 1 if in_list else current_idx
+                else:
+                    current_idx -= 1
+                entry = current_entries_list[current_idx % len(current_entries_list)]
+            current_line_offset = 0
+            mark_read(entry)
         elif key == curses.KEY_NPAGE:
             current_line_offset = min(
                 current_line_offset + display_height_for_content, len(lines_with_attr) - display_height_for_content)
@@ -599,12 +2204,128 @@ def read_article(stdscr, current_entries_list, initial_idx):
                 pass
 
 
+# Short human readable duration (e.g., 45s, 12m, 3h, 2d)
+def format_duration(seconds):
+    seconds = max(0, int(seconds))
+    for unit, size in (('d', 86400), ('h', 3600), ('m', 60)):
+        if seconds >= size:
+            return f"{seconds // size}{unit}"
+    return f"{seconds}s"
+
+# Frame of the list screens (feed health, timings, feed picker): the logo, a centered stats line and a
+# footer with the shortcuts. Returns (first row, number of rows, width) of the list area in between
+def draw_screen_frame(stdscr, stats_line, shortcuts_text):
+    begin_full_screen(stdscr)
+    max_y, max_x = stdscr.getmaxyx()
+    content_max_x = max_x - 2 * SCREEN_MARGIN
+
+    # Prominent ANCAP header with more readable ASCII art
+    ancap_line1 = "▄▀█ █▄ █ █▀▀ ▄▀█ █▀█"
+    ancap_line2 = "█▀█ █ ▀█ █▄▄ █▀█ █▀▀"
+    subtitle = "» A LIBERTARIAN RSS READER «"
+
+    # Center and display the ASCII logo
+    safe_addstr(stdscr, HEADER_TOP_PADDING, SCREEN_MARGIN + max(0, (content_max_x - len(ancap_line1)) // 2), ancap_line1, curses.color_pair(2))
+    safe_addstr(stdscr, HEADER_TOP_PADDING + 1, SCREEN_MARGIN + max(0, (content_max_x - len(ancap_line2)) // 2), ancap_line2, curses.color_pair(2))
+    safe_addstr(stdscr, HEADER_TOP_PADDING + 2, SCREEN_MARGIN + max(0, (content_max_x - len(subtitle)) // 2), subtitle, curses.color_pair(6))
+
+    safe_addstr(stdscr, HEADER_TOP_PADDING + 4, SCREEN_MARGIN + max(0, (content_max_x - len(stats_line)) // 2), stats_line, curses.color_pair(2))
+
+    footer_y = max_y - 2
+    safe_addstr(stdscr, footer_y, SCREEN_MARGIN, "─" * content_max_x, curses.color_pair(2))
+    safe_addstr(stdscr, footer_y + 1, SCREEN_MARGIN + max(0, (content_max_x - len(shortcuts_text)) // 2), shortcuts_text, curses.color_pair(2))
+
+    list_y = HEADER_TOP_PADDING + 6
+    return list_y, max(1, max_y - list_y - 3), content_max_x
+
+# Draw the rows of a scrollable list from offset (or empty_message when there are none), each with attr_of(row).
+# Returns the offset clamped to the rows, for the next scroll
+def draw_scrolled_rows(stdscr, rows, offset, list_y, display_height, width, empty_message, attr_of):
+    offset = max(0, min(offset, len(rows) - display_height))
+    if not rows:
+        safe_addstr(stdscr, list_y, SCREEN_MARGIN, empty_message, curses.color_pair(2))
+    for i, row in enumerate(rows[offset:offset + display_height]):
+        safe_addstr(stdscr, list_y + i, SCREEN_MARGIN, row[:width], attr_of(row))
+    return offset
+
+# Feed health display mode: failing feeds with their error class and circuit state
+def health_mode(stdscr):
+    offset = 0 # First row shown, for scrolling long lists
+    while True:
+        now = time.time()
+        with feed_health_lock:
+            failing = sorted((record for record in feed_health.values() if record.get('consecutive_failures', 0) > 0),
+                             key=lambda record: -record.get('consecutive_failures', 0))
+            rows = []
+            for record in failing:
+                if record.get('state') == 'open':
+                    timing = f"probe in {format_duration(record.get('next_probe', now) - now)}"
+                elif record.get('last_success'):
+                    timing = f"last ok {format_duration(now - record['last_success'])} ago"
+                else:
+                    timing = "never ok"
+                rows.append(f"{record.get('state', 'closed').upper():<9} {record.get('consecutive_failures', 0):>3}x "
+                            f"{record.get('error_class', ''):<24} {timing:<18} {record.get('title', '')}")
+        open_count = sum(1 for record in failing if record.get('state') == 'open')
+
+        stats_line = f"FEED HEALTH | FAILING: {len(rows)} | CIRCUITS OPEN: {open_count} | FEEDS: {len(FEEDS)}"
+        list_y, display_height, content_max_x = draw_screen_frame(stdscr, stats_line, "j/k=scroll q/ESC=back")
+        offset = draw_scrolled_rows(stdscr, rows, offset, list_y, display_height, content_max_x, _("all feeds are healthy."),
+                                    lambda row: curses.color_pair(2) if row.startswith('OPEN') else curses.color_pair(7))
+        stdscr.refresh()
+
+        key = stdscr.getch()
+        if key == ord('q') or key == 27 or key == ord('h'): # 'q', ESC or 'h' to go back
+            break
+        elif key == ord('j') or key == curses.KEY_DOWN:
+            offset += 1
+        elif key == ord('k') or key == curses.KEY_UP:
+            offset = max(0, offset - 1)
+
+# Short duration in milliseconds, or seconds from 10s up ('-' when unknown)
+def format_ms(seconds):
+    if seconds is None:
+        return "-"
+    return f"{seconds:.1f}s" if seconds >= 10 else f"{seconds * 1000:.0f}ms"
+
+# Feed timing display mode: p50/p95 of each stage of the latest fetches, slowest feeds first
+def timing_mode(stdscr):
+    offset = 0 # First row shown, for scrolling long lists
+    while True:
+        summary = summarize_feed_stats()
+        columns = f"{'TOTAL p50/p95':>15} {'CONNECT':>8} {'TTFB':>8} {'DOWNLOAD':>8} {'PARSE':>8} {'KB':>6} {'HTTP':>4} {'ITEMS':>5} {'ERR':>3}  FEED"
+        rows = []
+        for feed in summary:
+            total = f"{format_ms(feed['total']['p50'])}/{format_ms(feed['total']['p95'])}"
+            size = feed['bytes']['p50']
+            rows.append(f"{total:>15} {format_ms(feed['connect']['p50']):>8} {format_ms(feed['ttfb']['p50']):>8} "
+                        f"{format_ms(feed['download']['p50']):>8} {format_ms(feed['parse']['p50']):>8} "
+                        f"{size / 1024 if size is not None else 0:>6.0f} {feed['last_status'] or '-':>4} "
+                        f"{feed['last_entries'] or 0:>5} {feed['errors']:>3}  {feed['title']}")
+
+        stats_line = f"FEED TIMING | FEEDS: {len(summary)} | FETCHES: {sum(feed['fetches'] for feed in summary)} (last {FEED_STATS_WINDOW} per feed)"
+        list_y, display_height, content_max_x = draw_screen_frame(
+            stdscr, stats_line, "p50 of each stage, slowest p95 first | j/k=scroll q/ESC=back")
+        safe_addstr(stdscr, list_y, SCREEN_MARGIN, columns[:content_max_x], curses.color_pair(2))
+        offset = draw_scrolled_rows(stdscr, rows, offset, list_y + 1, max(1, display_height - 1), content_max_x,
+                                    _("no feeds fetched yet."), lambda row: curses.color_pair(7))
+        stdscr.refresh()
+
+        stdscr.timeout(1000) # Fetches finishing in the background show up while the screen is open
+        key = stdscr.getch()
+        stdscr.timeout(-1)
+        if key == ord('q') or key == 27 or key == ord('i'): # 'q', ESC or 'i' to go back
+            break
+        elif key == ord('j') or key == curses.KEY_DOWN:
+            offset += 1
+        elif key == ord('k') or key == curses.KEY_UP:
+            offset = max(0, offset - 1)
+
 # Favorites display mode
 def favorites_mode(stdscr):
-    idx = 0 # Index of selected article
     # If there are no favorites, don't enter the loop
     if not favorites:
-        stdscr.clear()
+        begin_full_screen(stdscr)
         max_y, max_x = stdscr.getmaxyx()
         
         # Prominent ANCAP header with more readable ASCII art
@@ -618,122 +2339,230 @@ def favorites_mode(stdscr):
         safe_addstr(stdscr, header_start_y + 1, max(0, (max_x - len(ancap_line2)) // 2), ancap_line2, curses.color_pair(2))
         safe_addstr(stdscr, header_start_y + 2, max(0, (max_x - len(subtitle)) // 2), subtitle, curses.color_pair(6))
         
-        safe_addstr(stdscr, max_y // 2 + 1, max(0, (max_x - len(_("no favorites yet.")))) // 2),
-        _("no favorites yet."), curses.color_pair(2) # No favorites message in yellow
+        safe_addstr(stdscr, max_y // 2 + 1, max(0, (max_x - len(_("no favorites yet."))) // 2),
+        _("no favorites yet."), curses.color_pair(2)) # No favorites message in yellow
         safe_addstr(stdscr, max_y // 2 + 2, max(0, (max_x - len(_("press any key to return."))) // 2),
         _("press any key to return."), curses.color_pair(2)) # Return message in yellow
         stdscr.refresh()
         stdscr.getch() # Wait for a key to return
         return
 
+    view_mode(stdscr, favorites)
+
+# Ask for a line of text on the bottom row; None if cancelled with ESC
+def prompt_input(stdscr, label):
+    text = ''
+    curses.curs_set(1) # Show the cursor while typing
+    try:
+        while True:
+            max_y, max_x = stdscr.getmaxyx()
+            line = label + text
+            stdscr.move(max_y - 1, 0)
+            stdscr.clrtoeol()
+            safe_addstr(stdscr, max_y - 1, 0, line[-(max_x - 1):], curses.color_pair(2))
+            stdscr.refresh() # Only the prompt row changed
+            key = stdscr.get_wch()
+            if key in ('\n', '\r', curses.KEY_ENTER):
+                return text
+            elif key == '\x1b': # ESC
+                return None
+            elif key in (curses.KEY_BACKSPACE, '\x7f', '\b'):
+                text = text[:-1]
+            elif isinstance(key, str) and key.isprintable():
+                text += key
+    finally:
+        curses.curs_set(0)
+        if feed_view is not None:
+            feed_view.invalidate() # The list comes back over the prompt row
+
+# Ask for a search and show its results within scope (the timeline or favorites)
+def search_mode(stdscr, scope):
+    text = prompt_input(stdscr, "/")
+    if text and text.strip():
+        view_mode(stdscr, search_articles(text, scope), label=f'SEARCH "{text.strip()}"')
+
+# Browse a list of articles other than the main timeline (favorites, search results)
+def view_mode(stdscr, timeline, label=None):
+    idx = 0 # Index of selected article
+    selected, selected_idx = (timeline[idx] if timeline else None), idx
+    seen_version = timeline_version
+    open_views.append(timeline) # Keep its counters in step with read changes while it is shown
+    try:
+        while True:
+            with entries_lock:
+                if seen_version != timeline_version and selected is not None:
+                    # Keep the cursor on the same article when the list changes
+                    idx = relocate_cursor(timeline, selected, selected_idx, idx)
+                seen_version = timeline_version
+                idx = max(0, min(idx, len(timeline) - 1))
+                selected = timeline[idx] if timeline else None
+                selected_idx = idx
+                draw_feed(stdscr, timeline, idx, label) # Draw the list
+            key = stdscr.getch()
+            if key == ord('q') or key == 27: # 'q' or ESC to go back
+                break
+            elif key == ord('/'): # '/' to search within this list's scope
+                search_mode(stdscr, favorites if timeline is favorites else entries)
+                continue
+            if not timeline:
+                continue # Nothing else to act on
+            # 'j' or down arrow for next article
+            if key == ord('j') or key == curses.KEY_DOWN:
+                if idx < len(timeline) - 1:
+                    idx += 1
+            # 'k' or up arrow for previous article
+            elif key == ord('k') or key == curses.KEY_UP:
+                if idx > 0:
+                    idx -= 1
+            elif key == ord(' '): # Space to read selected article
+                returned_idx = read_article(stdscr, timeline, idx)
+                idx = returned_idx # Update index after reading
+                seen_version = timeline_version # read_article already followed the list
+                if not timeline: # Every favorite was removed while reading
+                    break
+                selected, selected_idx = timeline[idx], idx
+                # Already marked as read inside read_article when entering
+                # mark_read(timeline[idx])
+            elif key == ord('o') or key == 10: # 'o' or Enter to open article
+                open_in_browser(timeline[idx])
+            # 's' or 'l' to save/mark as favorite (toggle)
+            elif key in [ord('s'), ord('l')]: # 's' or 'l' to save/mark as favorite (toggle)
+                toggle_favorite(timeline[idx])
+                # Adjust index if last element was removed
+                if idx >= len(timeline) and len(timeline) > 0:
+                    idx = len(timeline) - 1
+                elif len(timeline) == 0: # If no favorites remain, exit mode
+                    break
+            # 'u' to mark as unread
+            elif key == ord('u'):
+                mark_unread(timeline[idx])
+                # Redraw screen so article color changes
+                # No `continue` here because view_mode calls draw_feed again in each iteration
+            elif key == ord('m'): # 'm' to toggle mark all articles of the list as read/unread
+                # Count read and unread articles
+                unread_count = timeline.stats.unread
+                read_count = len(timeline) - unread_count
+
+                # If there are more unread than read, mark all as read
+                # If there are more read than unread, mark all as unread
+                if unread_count >= read_count:
+                    # Mark all articles of the list as read
+                    mark_all_read(timeline)
+                else:
+                    # Mark all articles of the list as unread
+                    mark_all_unread(timeline)
+            elif key == curses.KEY_MOUSE: # If mouse event is detected
+                try:
+                    # Get mouse event details
+                    id, x, y, z, bstate = curses.getmouse()
+                    if bstate & curses.BUTTON1_PRESSED: # Left mouse button clicked
+                        # The list view knows which article is drawn on each row
+                        clicked_absolute_idx = feed_view.entry_at(y, len(timeline))
+                        if clicked_absolute_idx is not None: # If click is within visible article list
+                            if clicked_absolute_idx < len(timeline):
+                                returned_idx = read_article(stdscr, timeline, clicked_absolute_idx)
+                                idx = returned_idx # Update index
+                                seen_version = timeline_version
+                                if not timeline:
+                                    break
+                                selected, selected_idx = timeline[idx], idx
+                                # Already marked as read inside read_article when entering
+                                # mark_read(timeline[idx])
+                    elif bstate & curses.BUTTON4_PRESSED: # Mouse wheel up (scroll up)
+                        if idx > 0:
+                            idx -= 1
+                    elif bstate & curses.BUTTON5_PRESSED: # Mouse wheel down (scroll down)
+                        if idx < len(timeline) - 1:
+                            idx += 1
+                except curses.error:
+                    pass # Ignore mouse errors
+    finally:
+        open_views.remove(timeline)
+
+# Pick the feed to show: None for all of them, or a feed title; returns current if cancelled
+def feed_picker(stdscr, current):
+    with entries_lock:
+        names = [name for name, url in FEEDS]
+        sources = [None] + names + sorted(source for source in entries.stats.by_feed if source not in names)
+    idx = sources.index(current) if current in sources else 0
     while True:
-        draw_feed(stdscr, favorites, idx) # Draw the favorites list
+        list_y, display_height, content_max_x = draw_screen_frame(
+            stdscr, f"SELECT FEED | FEEDS: {len(FEEDS)}", "j/k=nav SPACE/ENTER=show (unread/total) q/ESC=back")
+        # One row per feed with its unread and total counts, read from the timeline counters
+        start = max(0, min(idx - display_height // 2, len(sources) - display_height))
+        with entries_lock:
+            for i, source in enumerate(sources[start:start + display_height]):
+                total, unread = (len(entries), entries.stats.unread) if source is None else entries.stats.by_feed.get(source, (0, 0))
+                counts = f"{unread}/{total}"
+                name = _("All feeds") if source is None else source
+                name = name[:max(0, content_max_x - len(counts) - 3)]
+                attr = curses.color_pair(2) | curses.A_REVERSE if start + i == idx else curses.color_pair(7)
+                safe_addstr(stdscr, list_y + i, SCREEN_MARGIN, name.ljust(content_max_x - len(counts)) + counts, attr)
+        stdscr.refresh()
+
         key = stdscr.getch()
-        # Inside read_article function, after key = stdscr.getch()
-        stdscr.refresh() # Wait for user input
-        if key == ord('q') or key == 27: # 'q' or ESC to exit favorites mode
-            break
-        # 'j' or down arrow for next article
+        if key == ord('q') or key == 27 or key == ord('p'): # 'q', ESC or 'p' to go back unchanged
+            return current
         elif key == ord('j') or key == curses.KEY_DOWN:
-            if idx < len(favorites) - 1:
-                idx += 1
-        # 'k' or up arrow for previous article
+            idx = min(idx + 1, len(sources) - 1)
         elif key == ord('k') or key == curses.KEY_UP:
-            if idx > 0:
-                idx -= 1
-        elif key == ord(' '): # Space to read selected article
-            returned_idx = read_article(stdscr, favorites, idx)
-            idx = returned_idx # Update index after reading
-            # Already marked as read inside read_article when entering
-            # read_articles.add(getattr(favorites[idx], 'link', None))
-            # save_read_articles() # Save read articles
-        elif key == ord('o') or key == 10: # 'o' or Enter to open article
-            webbrowser.open(getattr(favorites[idx], 'link', ''))
-        # 's' or 'l' to save/mark as favorite (toggle)
-        elif key in [ord('s'), ord('l')] and entries: # 's' or 'l' to save/mark as favorite (toggle)
-            article = favorites[idx]
-            link_to_toggle = getattr(article, 'link', None)
-            if link_to_toggle in favorite_links: # If already favorite, remove it
-                favorites[:] = [fav for fav in favorites if getattr(fav, 'link', None) != link_to_toggle]
-                favorite_links.remove(link_to_toggle)
-            else: # If not favorite, add it
-                favorites.append(article)
-                favorite_links.add(link_to_toggle)
-            # Re-sort favorites list after adding/removing
-            favorites.sort(key=lambda e: time.mktime(getattr(e, 'published_parsed', time.gmtime(0))), reverse=True)
-            save_favorites() # Save favorites
-            # Adjust index if last element was removed
-            if idx >= len(favorites) and len(favorites) > 0:
-                idx = len(favorites) - 1
-            elif len(favorites) == 0: # If no favorites remain, exit mode
-                break
-        # 'u' to mark as unread
-        elif key == ord('u'):
-            link_to_unmark = getattr(favorites[idx], 'link', None)
-            if link_to_unmark in read_articles:
-                read_articles.remove(link_to_unmark)
-                save_read_articles()
-            # Redraw screen so article color changes
-            # No `continue` here because favorites_mode calls draw_feed again in each iteration
-        elif key == ord('m'): # 'm' to toggle mark all favorites as read/unread
-            # Count read and unread favorites
-            read_count = sum(1 for fav in favorites if getattr(fav, 'link', None) in read_articles)
-            unread_count = len(favorites) - read_count
-            
-            # If there are more unread than read, mark all as read
-            # If there are more read than unread, mark all as unread
-            if unread_count >= read_count:
-                # Mark all favorites as read
-                for fav in favorites:
-                    fav_link = getattr(fav, 'link', None)
-                    if fav_link:
-                        read_articles.add(fav_link)
-            else:
-                # Mark all favorites as unread
-                for fav in favorites:
-                    fav_link = getattr(fav, 'link', None)
-                    if fav_link and fav_link in read_articles:
-                        read_articles.remove(fav_link)
-            save_read_articles()
-        elif key == curses.KEY_MOUSE: # If mouse event is detected
-            try:
-                # Get mouse event details
-                id, x, y, z, bstate = curses.getmouse()
-                # Mouse wheel up (scroll up)
-                if bstate & curses.BUTTON4_PRESSED: # Left mouse button clicked
-                    # Calculate visible start on screen
-                    display_height = max_y - 7 # Adjusted to leave an extra blank line
-                    start_display_row = 3
-                    if len(favorites) > display_height:
-                        current_screen_start_idx = max(
-                            0, idx - display_height // 2)
-                        current_screen_start_idx = min(
-                            current_screen_start_idx, len(favorites) - display_height)
-                    else:
-                        current_screen_start_idx = 0
-
-                    # If click is within visible article list
-                    if y >= start_display_row and y < start_display_row + display_height:
-                        clicked_idx_on_screen = y - start_display_row # Calculate relative screen index
-                        clicked_absolute_idx = current_screen_start_idx + clicked_idx_on_screen
-                        
-                        if clicked_absolute_idx < len(favorites):
-                            returned_idx = read_article(stdscr, favorites, clicked_absolute_idx)
-                            idx = returned_idx # Update index
-                            # Already marked as read inside read_article when entering
-                            # read_articles.add(getattr(favorites[idx], 'link', None))
-                            # save_read_articles()
-                elif bstate & curses.BUTTON4_PRESSED: # Mouse wheel up (scroll up)
-                    if idx > 0:
-                        idx -= 1
-                elif bstate & curses.BUTTON5_PRESSED: # Mouse wheel down (scroll down)
-                    if idx < len(favorites) - 1:
-                        idx += 1
-            except curses.error:
-                pass # Ignore mouse errors
+            idx = max(0, idx - 1)
+        elif key in (ord(' '), 10, 13, curses.KEY_ENTER): # Space or Enter to show the feed
+            return sources[idx]
+
+# Loading screen: logo, progress of the first fetch and the feeds failing so far
+def draw_loading_screen(stdscr):
+    begin_full_screen(stdscr)
+    max_y, max_x = stdscr.getmaxyx()
+    
+    # Prominent ANCAP header with more readable ASCII art
+    ancap_line1 = "▄▀█ █▄ █ █▀▀ ▄▀█ █▀█"
+    ancap_line2 = "█▀█ █ ▀█ █▄▄ █▀█ █▀▀"
+    subtitle = "» A LIBERTARIAN RSS READER «"
+    
+    # Center and display the ASCII logo
+    header_start_y = max_y // 2 - 8
+    safe_addstr(stdscr, header_start_y, max(0, (max_x - len(ancap_line1)) // 2), ancap_line1, curses.color_pair(2))
+    safe_addstr(stdscr, header_start_y + 1, max(0, (max_x - len(ancap_line2)) // 2), ancap_line2, curses.color_pair(2))
+    safe_addstr(stdscr, header_start_y + 2, max(0, (max_x - len(subtitle)) // 2), subtitle, curses.color_pair(6))
+    
+    # Blank line
+    safe_addstr(stdscr, header_start_y + 3, 0, "")
+
+    loading_message = _("loading feeds... please wait") # Loading message (translatable)
+    safe_addstr(stdscr, max_y // 2 - 1, max(0, (max_x - len(loading_message)) // 2),
+                loading_message, curses.color_pair(2)) # In yellow
+
+    # Progress bar
+    total_feeds = len(FEEDS) 
+    if total_feeds == 0: # Empty feeds case, to avoid division by zero
+        progress_percent = 0
+    else:
+        progress_percent = int((entries_loaded / total_feeds) * 100)
+    
+    bar_length = max_x - 20 # Progress bar length
+    if bar_length < 0: bar_length = 0 # Ensure it's not negative
+    
+    filled_length = int(bar_length * progress_percent / 100)
+    bar = '█' * filled_length + '-' * (bar_length - filled_length)
+    
+    progress_text = f"[{bar}] {progress_percent}%"
+    safe_addstr(stdscr, max_y // 2 + 1, max(0, (max_x - len(progress_text)) // 2),
+                progress_text, curses.color_pair(2)) # In yellow
+
+    # Display problematic feeds if any
+    if problematic_feeds:
+        error_message = "Feeds with issues: " + ", ".join(f"{title}: {problem}" for title, problem in list(problematic_feeds.items()))
+        # Truncate message if too long
+        if len(error_message) > max_x - 4:
+            error_message = error_message[:max_x - 7] + "..."
+        safe_addstr(stdscr, max_y // 2 + 3, max(0, (max_x - len(error_message)) // 2), error_message, curses.color_pair(7))
+    stdscr.refresh()
 
 # Main program
 def main(stdscr):
+    if profile_stats is not None:
+        stdscr = ProfiledScreen(stdscr) # Profile the handling of each key, not the wait for it
     stdscr.clear() # Clear the screen
     curses.curs_set(0) # Hide the cursor
     curses.start_color() # Start curses color system
@@ -746,70 +2575,35 @@ def main(stdscr):
 
     curses.mousemask(curses.ALL_MOUSE_EVENTS | curses.REPORT_MOUSE_POSITION) # Enable all mouse events and position tracking
 
-    global entries  # Declare entries as global to ensure it is accessible
-    entries = []  # Initialize entries as an empty list
-
     logging.debug(f"FEEDS loaded: {FEEDS}")
+    # Warm start: show the stored timeline right away while fresh fetches run in the background
+    merge_entries(load_archive_page())
+    # First frame before the fetch threads start importing requests and the parsers
+    if entries:
+        with entries_lock:
+            draw_feed(stdscr, entries, 0)
+    else:
+        draw_loading_screen(stdscr)
+    logging.info(f"First frame painted {(time.perf_counter() - startup_clock) * 1000:.0f} ms after import.")
     logging.debug("Starting thread for fetch_entries_background.")
     thread = threading.Thread(
         target=fetch_entries_background, args=(FEEDS,), daemon=True)
     thread.start()
     logging.debug("Thread started.")
+    # Keep feeds up to date for long-running sessions
+    threading.Thread(target=refresh_feeds_background, args=(FEEDS,), daemon=True).start()
+    # Make articles stored before the search index existed searchable
+    threading.Thread(target=index_archive_for_search, daemon=True).start()
 
     idx = 0
 
     while not entries and thread.is_alive():
         logging.debug(f"Entries still empty. Thread alive: {thread.is_alive()}")
-        stdscr.clear()
-        max_y, max_x = stdscr.getmaxyx()
-        
-        # Prominent ANCAP header with more readable ASCII art
-        ancap_line1 = "▄▀█ █▄ █ █▀▀ ▄▀█ █▀█"
-        ancap_line2 = "█▀█ █ ▀█ █▄▄ █▀█ █▀▀"
-        subtitle = "» A LIBERTARIAN RSS READER «"
-        
-        # Center and display the ASCII logo
-        header_start_y = max_y // 2 - 8
-        safe_addstr(stdscr, header_start_y, max(0, (max_x - len(ancap_line1)) // 2), ancap_line1, curses.color_pair(2))
-        safe_addstr(stdscr, header_start_y + 1, max(0, (max_x - len(ancap_line2)) // 2), ancap_line2, curses.color_pair(2))
-        safe_addstr(stdscr, header_start_y + 2, max(0, (max_x - len(subtitle)) // 2), subtitle, curses.color_pair(6))
-        
-        # Blank line
-        safe_addstr(stdscr, header_start_y + 3, 0, "")
-
-        loading_message = _("loading feeds... please wait") # Loading message (translatable)
-        safe_addstr(stdscr, max_y // 2 - 1, max(0, (max_x - len(loading_message)) // 2),
-                    loading_message, curses.color_pair(2)) # In yellow
-
-        # Progress bar
-        total_feeds = len(FEEDS) 
-        if total_feeds == 0: # Empty feeds case, to avoid division by zero
-            progress_percent = 0
-        else:
-            progress_percent = int((entries_loaded / total_feeds) * 100)
-        
-        bar_length = max_x - 20 # Progress bar length
-        if bar_length < 0: bar_length = 0 # Ensure it's not negative
-        
-        filled_length = int(bar_length * progress_percent / 100)
-        bar = '█' * filled_length + '-' * (bar_length - filled_length)
-        
-        progress_text = f"[{bar}] {progress_percent}%"
-        safe_addstr(stdscr, max_y // 2 + 1, max(0, (max_x - len(progress_text)) // 2),
-                    progress_text, curses.color_pair(2)) # In yellow
-
-        stdscr.refresh()
-        # Display problematic feeds if any
-        if problematic_feeds:
-            error_message = "Feeds with issues: " + ", ".join(problematic_feeds)
-            # Truncate message if too long
-            if len(error_message) > max_x - 4:
-                error_message = error_message[:max_x - 7] + "..."
-            safe_addstr(stdscr, max_y // 2 + 3, max(0, (max_x - len(error_message)) // 2), error_message, curses.color_pair(7))
+        draw_loading_screen(stdscr)
         time.sleep(0.1) # Wait a bit before checking again
 
     if not entries and not thread.is_alive(): # If no entries loaded and thread finished
-        stdscr.clear()
+        begin_full_screen(stdscr)
         max_y, max_x = stdscr.getmaxyx()
         
         # Prominent ANCAP header with more readable ASCII art
@@ -832,11 +2626,33 @@ def main(stdscr):
         stdscr.getch()
         return # Exit the program
 
+    selected, selected_idx = None, 0 # Article under the cursor, followed across background merges
+    seen_version = timeline_version
+    view_source, unread_only = None, False # Filters of the list shown: one feed (None for all) and unread articles only
+    view = entries
     while True: # Main interface loop
-        draw_feed(stdscr, entries, idx) # Draw the main feeds screen
+        if idx >= len(view) - ARCHIVE_PREFETCH_MARGIN:
+            # Page older articles in from the store as the cursor approaches the end of the list shown;
+            # unread-only lists are not paged, as most of the archive would be read to fill a short one
+            if view is entries:
+                if not archive_exhausted:
+                    merge_entries(load_archive_page())
+            elif view_source is not None and not unread_only and not archive_exhausted and view_source not in archive_feeds_exhausted:
+                merge_entries(load_feed_archive_page(view_source))
+        with entries_lock:
+            if seen_version != timeline_version and selected is not None:
+                # Newly merged feeds shift positions; keep the cursor on the same article
+                idx = relocate_cursor(view, selected, selected_idx, idx)
+            seen_version = timeline_version
+            idx = max(0, min(idx, len(view) - 1))
+            selected = view[idx] if view else None
+            selected_idx = idx
+            label = " | ".join(part for part in (view_source and f"FEED: {view_source}", unread_only and "UNREAD ONLY") if part)
+            draw_feed(stdscr, view, idx, label or None) # Draw the main feeds screen
         
-        # Set a timeout so the screen refreshes every 30 seconds to update time
-        stdscr.timeout(30000)  # 30 seconds timeout
+        # Set a timeout so the screen refreshes every 30 seconds to update time,
+        # or quickly while feeds are still arriving so they show up as they finish
+        stdscr.timeout(30000 if loading_done else 250)
         key = stdscr.getch() # Wait for user input (keyboard or mouse)
         stdscr.timeout(-1)  # Reset to blocking mode
         
@@ -847,68 +2663,71 @@ def main(stdscr):
         if key == ord('q') or key == 27: # 'q' or ESC to exit the program
             break
         elif key == ord('j') or key == curses.KEY_DOWN: # 'j' or down arrow for next article
-            if idx < len(entries) - 1:
+            if idx < len(view) - 1:
                 idx += 1
         elif key == ord('k') or key == curses.KEY_UP: # 'k' or up arrow for previous article
             if idx > 0:
                 idx -= 1
         elif key == ord(' '): # Space to read selected article
-            if entries: # Ensure there are articles to read
-                returned_idx = read_article(stdscr, entries, idx) # Pass the list and index
+            if view: # Ensure there are articles to read
+                returned_idx = read_article(stdscr, view, idx) # Pass the list and index
                 idx = returned_idx # Update main index with returned one
+                seen_version = timeline_version # read_article already followed the timeline
                 # Marking as read is already done inside read_article when entering
-                # read_articles.add(getattr(entries[idx], 'link', None))
-                # save_read_articles() # Save read articles changes
-        elif key == ord('o') and entries:
-            webbrowser.open(getattr(entries[idx], 'link', ''))
-        elif key in [ord('s'), ord('l')] and entries: # 's' or 'l' to save/mark as favorite (toggle)
-            article = entries[idx]
-            link_to_toggle = getattr(article, 'link', None)
-            if link_to_toggle in favorite_links: # If already favorite, remove it
-                favorites[:] = [fav for fav in favorites if getattr(fav, 'link', None) != link_to_toggle]
-                favorite_links.remove(link_to_toggle)
-            else: # If not favorite, add it
-                favorites.append(article)
-                favorite_links.add(link_to_toggle)
-            # Re-sort favorites list after adding/removing
-            favorites.sort(key=lambda e: time.mktime(getattr(e, 'published_parsed', time.gmtime(0))), reverse=True)
-            save_favorites() # Save favorites
-        elif key == ord('u') and entries: # 'u' to mark as unread
-            link_to_unmark = getattr(entries[idx], 'link', None)
-            if link_to_unmark in read_articles:
-                read_articles.remove(link_to_unmark)
-                save_read_articles()
-            # No need for `stdscr.clear()` here because `draw_feed` handles that.
-            # Simply update state and redraw in next main loop iteration.
-        elif key == ord('m') and entries: # 'm' to toggle mark all as read/unread
+                # mark_read(entries[idx])
+        elif key == ord('o') and view:
+            open_in_browser(view[idx])
+        elif key in [ord('s'), ord('l')] and view: # 's' or 'l' to save/mark as favorite (toggle)
+            toggle_favorite(view[idx])
+        elif key == ord('u') and view: # 'u' to mark as unread
+            mark_unread(view[idx])
+            # No need to redraw here: `draw_feed` repaints the rows that changed in the next main loop iteration.
+        elif key == ord('m') and view: # 'm' to toggle mark all as read/unread
             # Count read and unread articles
-            read_count = sum(1 for entry in entries if getattr(entry, 'link', None) in read_articles)
-            unread_count = len(entries) - read_count
+            unread_count = view.stats.unread
+            read_count = len(view) - unread_count
             
             # If there are more unread than read, mark all as read
             # If there are more read than unread, mark all as unread
             if unread_count >= read_count:
-                # Mark all as read
-                for entry in entries:
-                    entry_link = getattr(entry, 'link', None)
-                    if entry_link:
-                        read_articles.add(entry_link)
+                # Mark all as read: one watermark per feed
+                mark_all_read(view)
             else:
                 # Mark all as unread
-                for entry in entries:
-                    entry_link = getattr(entry, 'link', None)
-                    if entry_link and entry_link in read_articles:
-                        read_articles.remove(entry_link)
-            save_read_articles()
+                mark_all_unread(view)
+        elif key == ord('n') and view: # 'n' to jump to the next unread article, wrapping around
+            with entries_lock:
+                unread_view = view_timeline(view_source, unread_only=True)
+                if unread_view:
+                    pos, found = unread_view.locate(view[idx])
+                    target = unread_view[(pos + 1 if found else pos) % len(unread_view)]
+                    idx = max(0, view.index_of(target))
+        elif key == ord('U'): # 'U' to show only unread articles, or everything again
+            unread_only = not unread_only
+            with entries_lock:
+                view = view_timeline(view_source, unread_only)
+                idx = max(0, view.locate(selected)[0]) if selected is not None else 0
+            selected = None # Start from the position found, not the old article
+        elif key == ord('p'): # 'p' to pick the feed shown
+            view_source = feed_picker(stdscr, view_source)
+            with entries_lock:
+                view = view_timeline(view_source, unread_only)
+            idx, selected = 0, None
         elif key == ord('f'): # 'f' to enter favorites mode
             favorites_mode(stdscr)
+        elif key == ord('/'): # '/' to search the archive
+            search_mode(stdscr, entries)
+        elif key == ord('h'): # 'h' to see which feeds are failing
+            health_mode(stdscr)
+        elif key == ord('i'): # 'i' to see how long each feed takes to fetch
+            timing_mode(stdscr)
         elif key == ord('t') or key == ord('T'): # 't' or 'T' to translate (functionality pending integration with external API)
             pass
         elif key == curses.KEY_NPAGE: # Page Down key to advance one page in the list
-            num_display_lines = max_y - 7 # Space for articles (adjusted for new height calculation)
-            idx = min(idx + num_display_lines, len(entries) - 1) # Advance the index
+            num_display_lines = max(1, feed_view.list_height) # Rows of articles on screen
+            idx = max(0, min(idx + num_display_lines, len(view) - 1)) # Advance the index
         elif key == curses.KEY_PPAGE: # Page Up key to go back one page in the list
-            num_display_lines = max_y - 7
+            num_display_lines = max(1, feed_view.list_height)
             idx = max(0, idx - num_display_lines) # Go back the index
         elif key == curses.KEY_MOUSE: # If mouse event is detected
             try:
@@ -921,36 +2740,120 @@ def main(stdscr):
                         idx -= 1
                 # Mouse wheel down (scroll down)
                 elif bstate & curses.BUTTON5_PRESSED:
-                    if idx < len(entries) - 1:
+                    if idx < len(view) - 1:
                         idx += 1
                 elif bstate & curses.BUTTON1_PRESSED: # Left mouse button clicked
-                    # Calculate visible start on screen
-                    display_height = max_y - 7 # Height available for articles
-                    start_display_row = 3 # Row where articles start
-                    
-                    if len(entries) > display_height:
-                        # Ensure current_screen_start_idx is not negative
-                        current_screen_start_idx = max(0, idx - display_height // 2)
-                        # Ensure it doesn't exceed the end of the list
-                        current_screen_start_idx = min(current_screen_start_idx, len(entries) - display_height)
-                    else:
-                        current_screen_start_idx = 0
-
-                    # Make sure the click is within the articles area
-                    if y >= start_display_row and y < start_display_row + display_height:
-                        clicked_idx_on_screen = y - start_display_row # Calculate relative screen index
-                        clicked_absolute_idx = current_screen_start_idx + clicked_idx_on_screen
-                        
-                        if clicked_absolute_idx < len(entries): # Ensure index is valid
+                    # The list view knows which article is drawn on each row
+                    clicked_absolute_idx = feed_view.entry_at(y, len(view))
+                    if clicked_absolute_idx is not None: # Make sure the click is on an article
+                        if clicked_absolute_idx < len(view): # Ensure index is valid
                             idx = clicked_absolute_idx # Update selected index
                             # Now we open the article on click
-                            returned_idx = read_article(stdscr, entries, idx)
+                            returned_idx = read_article(stdscr, view, idx)
                             idx = returned_idx # Update main index with returned one
+                            seen_version = timeline_version
                             # Marking as read is already done inside read_article when entering
-                            # read_articles.add(getattr(entries[idx], 'link', None))
-                            # save_read_articles()
+                            # mark_read(entries[idx])
             except curses.error:
                 pass # Ignore mouse errors
 
+# Writes articles to a stream as ndjson (one object per line), a json array or csv, one feed at a time
+class ArticleExporter:
+    FIELDS = Article.__slots__ + ('read',)
+
+    def __init__(self, stream, export_format, unread_only=False):
+        self.stream = stream
+        self.export_format = export_format
+        self.unread_only = unread_only
+        self.seen = {} # Identity key -> article already written, so cross-posts are exported once
+        self.count = 0
+        if export_format == 'csv':
+            self.csv_writer = csv.DictWriter(stream, fieldnames=self.FIELDS)
+            self.csv_writer.writeheader()
+        elif export_format == 'json':
+            stream.write('[')
+
+    def write_feed(self, feed_entries):
+        for article in sorted(feed_entries, key=lambda article: -article.timestamp):
+            if find_duplicate(article, self.seen) is not None:
+                continue
+            for key in entry_identity_keys(article):
+                self.seen.setdefault(key, article)
+            read = is_read(article)
+            if self.unread_only and read:
+                continue
+            record = {field: getattr(article, field) for field in Article.__slots__}
+            record['read'] = read
+            if self.export_format == 'csv':
+                self.csv_writer.writerow(record)
+            elif self.export_format == 'json':
+                self.stream.write((',\n' if self.count else '\n') + json.dumps(record, ensure_ascii=False))
+            else:
+                self.stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self.count += 1
+        self.stream.flush() # Consumers see each feed as soon as it arrives
+
+    def close(self):
+        if self.export_format == 'json':
+            self.stream.write('\n]\n' if self.count else ']\n')
+        self.stream.flush()
+
+# Command line options; without --fetch-only or --export the curses interface starts
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='ANCAP RSS reader. Without options it starts the terminal interface.')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--fetch-only', action='store_true',
+                      help='fetch every feed into the article store and caches, then exit (e.g., from cron)')
+    mode.add_argument('--export', choices=('ndjson', 'json', 'csv'),
+                      help='fetch the feeds and write their articles to stdout as each feed arrives')
+    mode.add_argument('--feed-stats', action='store_true',
+                      help='write the fetch timings of each feed (p50/p95, slowest first) to stdout as JSON')
+    parser.add_argument('--profile', action='store_true',
+                        help='profile fetching and the handling of each key, and write the reports to the logs directory on exit')
+    parser.add_argument('--unread-only', action='store_true', help='export only unread articles')
+    parser.add_argument('--source', action='append', metavar='TITLE',
+                        help='only this feed, by its title in custom_feeds.json (can be repeated)')
+    args = parser.parse_args(argv)
+    if args.unread_only and not args.export:
+        parser.error('--unread-only requires --export')
+    if args.source:
+        unknown = sorted(set(args.source) - {name for name, url in FEEDS})
+        if unknown:
+            parser.error(f"unknown feed: {', '.join(unknown)}")
+    return args
+
+# Fetch the feeds without the interface: warm the caches, or stream the articles out as they arrive
+def run_batch(args):
+    feed_list = [(name, url) for name, url in FEEDS if not args.source or name in args.source]
+    if not feed_list:
+        print(_("NO FEEDS LOADED OR CUSTOM_FEEDS.JSON IS EMPTY/INVALID."), file=sys.stderr)
+        return 1
+    if args.fetch_only:
+        fetch_entries_background(feed_list, publish=lambda feed_entries: None) # Only the store and caches are wanted
+        logging.info(f'Fetch-only run finished: {len(feed_list)} feeds, {len(problematic_feeds)} with issues.')
+        return 0
+    exporter = ArticleExporter(sys.stdout, args.export, args.unread_only)
+    try:
+        fetch_entries_background(feed_list, publish=exporter.write_feed)
+        exporter.close()
+    except BrokenPipeError:
+        # The reader went away (e.g., piped into head); silence the final flush of stdout
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    return 0
+
 if __name__ == "__main__":
-    curses.wrapper(main)
\ No newline at end of file
+    init_app()
+    args = parse_args()
+    if args.feed_stats:
+        json.dump(summarize_feed_stats(), sys.stdout, indent=2)
+        print()
+        sys.exit(0)
+    if args.profile:
+        enable_profiling()
+    try:
+        if args.fetch_only or args.export:
+            sys.exit(run_batch(args))
+        curses.wrapper(main)
+    finally:
+        write_profile_reports()
\ No newline at end of file
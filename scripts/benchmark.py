@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+ANCAP RSS Reader Benchmark Suite
+Serves a generated corpus from a local HTTP server and measures startup, fetching,
+parsing, HTML formatting and list drawing. Results are written as JSON so runs can be
+compared. Nothing leaves the machine, and the real data/ and logs/ are never touched.
+
+Usage:
+    python scripts/benchmark.py --feeds 50 --entries 50 --output benchmark.json
+    python scripts/benchmark.py --latency 200 --error-rate 0.1 --format mixed
+"""
+
+import argparse
+import email.utils
+import http.server
+import importlib
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+APP_PATH = Path(__file__).resolve().parent.parent / "ancap_rss.py"
+
+WORDS = ("market", "liberty", "price", "trade", "money", "state", "order", "capital",
+         "contract", "property", "choice", "value", "labor", "credit", "bank", "law")
+
+# ---------------------------------------------------------------------------
+# Synthetic corpus and server
+# ---------------------------------------------------------------------------
+
+def make_body(rng, size):
+    """HTML article body of about size bytes, with paragraphs, emphasis, links and images"""
+    parts = []
+    length = 0
+    while length < size:
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 60)))
+        kind = rng.random()
+        if kind < 0.15:
+            chunk = f'<p><img src="http://img.example/{rng.randint(0, 9999)}.png" alt="figure"> {words}</p>'
+        elif kind < 0.4:
+            chunk = f'<p>{words} <a href="http://link.example/{rng.randint(0, 9999)}">more</a> <b>{rng.choice(WORDS)}</b></p>'
+        elif kind < 0.5:
+            chunk = f"<ul><li>{words}</li><li><i>{rng.choice(WORDS)}</i></li></ul>"
+        else:
+            chunk = f"<p>{words}</p>"
+        parts.append(chunk)
+        length += len(chunk)
+    return "".join(parts)
+
+def make_feed(index, entries, body_size, feed_format, seed):
+    """Generated RSS 2.0 or Atom document for feed number index (the same bytes for the same seed)"""
+    rng = random.Random(seed * 100003 + index)
+    name = f"bench{index}"
+    base = 1_700_000_000 - index * 60
+    items = []
+    for i in range(entries):
+        title = " ".join(rng.choice(WORDS) for _ in range(6)).capitalize()
+        link = f"http://{name}.example/articles/{i}"
+        body = make_body(rng, body_size)
+        stamp = base - i * 3600
+        if feed_format == "atom":
+            updated = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(stamp))
+            items.append(f"<entry><title>{title}</title><link href=\"{link}\"/><id>{name}-{i}</id>"
+                         f"<updated>{updated}</updated><summary type=\"html\">{escape_xml(body)}</summary></entry>")
+        else:
+            items.append(f"<item><title>{title}</title><link>{link}</link><guid>{name}-{i}</guid>"
+                         f"<pubDate>{email.utils.formatdate(stamp)}</pubDate><description>{escape_xml(body)}</description></item>")
+    if feed_format == "atom":
+        document = (f'<?xml version="1.0" encoding="utf-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+                    f"<title>{name}</title><id>{name}</id>{''.join(items)}</feed>")
+    else:
+        document = (f'<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel><title>{name}</title>'
+                    f"<ttl>30</ttl>{''.join(items)}</channel></rss>")
+    return document.encode("utf-8")
+
+def escape_xml(text):
+    """Escape text for an XML element"""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+class Corpus:
+    """Feed documents served by the benchmark server, generated once per run"""
+
+    def __init__(self, args):
+        self.latency = args.latency / 1000
+        self.jitter = args.jitter / 1000
+        self.documents = {}
+        rng = random.Random(args.seed)
+        self.failing = set()
+        for index in range(args.feeds):
+            feed_format = args.format if args.format != "mixed" else ("atom" if index % 2 else "rss")
+            self.documents[f"/feed/{index}"] = make_feed(index, args.entries, args.body_size, feed_format, args.seed)
+            if rng.random() < args.error_rate:
+                self.failing.add(f"/feed/{index}")
+
+    def feed_list(self, port):
+        """(title, url) pairs as custom_feeds.json holds them"""
+        return [[f"Bench {path.rsplit('/', 1)[1]}", f"http://127.0.0.1:{port}{path}"] for path in self.documents]
+
+def make_handler(corpus):
+    """Request handler serving the corpus with its latency, errors and ETags"""
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            delay = corpus.latency + (random.uniform(0, corpus.jitter) if corpus.jitter else 0)
+            if delay:
+                time.sleep(delay)
+            document = corpus.documents.get(self.path)
+            if document is None or self.path in corpus.failing:
+                self.send_response(404 if document is None else 500)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            etag = f'"{self.path}-{len(document)}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/xml")
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(document)))
+            self.end_headers()
+            self.wfile.write(document)
+
+    return Handler
+
+def start_server(corpus):
+    """Serve the corpus on a free local port from a background thread"""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), make_handler(corpus))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# ---------------------------------------------------------------------------
+# Stages, each run in a fresh interpreter (see run_worker)
+# ---------------------------------------------------------------------------
+
+def load_app(workdir):
+    """Import the copy of ancap_rss.py in workdir and load its state; returns (module, timings in seconds)"""
+    sys.path.insert(0, workdir)
+    started = time.perf_counter()
+    app = importlib.import_module("ancap_rss")
+    timings = {"import_s": time.perf_counter() - started}
+    if hasattr(app, "init_app"): # Older revisions load their state on import
+        started = time.perf_counter()
+        app.init_app()
+        timings["init_s"] = time.perf_counter() - started
+    return app, timings
+
+def percentiles(samples):
+    """Summary of a list of durations in seconds, reported in milliseconds"""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.mean(ordered) * 1000,
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+def stage_fetch(workdir, options):
+    """End-to-end fetch_entries_background: download, parse, store and merge every feed"""
+    app, timings = load_app(workdir)
+    started = time.perf_counter()
+    app.fetch_entries_background(app.FEEDS)
+    return {
+        **timings,
+        "fetch_s": time.perf_counter() - started,
+        "feeds": len(app.FEEDS),
+        "failed_feeds": len(app.problematic_feeds),
+        "entries": len(app.entries),
+    }
+
+def stage_parse(workdir, options):
+    """Parse stages per feed: feedparser plus compaction, then normalization into Article records"""
+    import urllib.request
+    app, _ = load_app(workdir)
+    documents = []
+    for title, url in app.FEEDS:
+        try:
+            with urllib.request.urlopen(url, timeout=30) as response:
+                documents.append((title, response.read()))
+        except OSError:
+            pass # Failing feeds have nothing to parse
+    parse_times, normalize_times, articles = [], [], []
+    for title, document in documents:
+        started = time.perf_counter()
+        hints, parsed_entries = app.parse_feed_content(document)
+        parse_times.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        articles.extend(app.Article.from_parsed(item, title) for item in parsed_entries)
+        normalize_times.append(time.perf_counter() - started)
+    total_bytes = sum(len(document) for title, document in documents)
+    parse_total = sum(parse_times)
+    return {
+        "feeds": len(documents),
+        "entries": len(articles),
+        "bytes": total_bytes,
+        "parse_per_feed": percentiles(parse_times),
+        "normalize_per_feed": percentiles(normalize_times),
+        "parse_mb_per_s": total_bytes / parse_total / 1e6 if parse_total else None,
+    }
+
+def init_colors():
+    """The color pairs main() sets up"""
+    import curses
+    curses.start_color()
+    for pair, color in ((2, curses.COLOR_YELLOW), (6, 255), (7, 248), (8, 8)):
+        curses.init_pair(pair, color if color < curses.COLORS else curses.COLOR_WHITE, curses.COLOR_BLACK)
+
+def stage_format(workdir, options):
+    """format_html_content throughput over every article body, for each available HTML engine"""
+    import curses
+    app, _ = load_app(workdir)
+    app.fetch_entries_background(app.FEEDS)
+    bodies = [article.summary or "" for article in app.entries]
+    total_bytes = sum(len(body.encode("utf-8")) for body in bodies)
+    results = {"articles": len(bodies), "bytes": total_bytes, "width": options["width"]}
+    lxml = app.load_lxml() if hasattr(app, "load_lxml") else app.etree
+    engines = ["bs4"] + (["lxml"] if lxml else [])
+
+    def format_all(stdscr):
+        init_colors() # Formatted lines carry curses attributes
+        for engine in engines:
+            app.HTML_ENGINE = engine
+            times = []
+            for body in bodies:
+                started = time.perf_counter()
+                app.format_html_content(body, options["width"])
+                times.append(time.perf_counter() - started)
+            total = sum(times)
+            results[engine] = {
+                "per_article": percentiles(times),
+                "articles_per_s": len(times) / total if total else None,
+                "mb_per_s": total_bytes / total / 1e6 if total else None,
+            }
+
+    curses.wrapper(format_all)
+    return results
+
+def stage_draw(workdir, options):
+    """draw_feed frame times against a curses screen on a pseudo-terminal"""
+    import curses
+    app, _ = load_app(workdir)
+    app.fetch_entries_background(app.FEEDS)
+    frames = options["frames"]
+    results = {"entries": len(app.entries), "rows": options["rows"], "columns": options["columns"]}
+
+    def draw(stdscr):
+        init_colors()
+        started = time.perf_counter()
+        app.draw_feed(stdscr, app.entries, 0)
+        results["first_frame_ms"] = (time.perf_counter() - started) * 1000
+        # Cursor moving down one article per frame, then a page at a time
+        count = len(app.entries)
+        step_times = []
+        for idx in range(1, min(frames, count)):
+            started = time.perf_counter()
+            app.draw_feed(stdscr, app.entries, idx)
+            step_times.append(time.perf_counter() - started)
+        results["cursor_step"] = percentiles(step_times)
+        page = max(1, app.feed_view.list_height)
+        page_times = []
+        for idx in range(0, count, page)[:frames]:
+            started = time.perf_counter()
+            app.draw_feed(stdscr, app.entries, idx)
+            page_times.append(time.perf_counter() - started)
+        results["page_step"] = percentiles(page_times)
+
+    curses.wrapper(draw)
+    return results
+
+def stage_startup(workdir, options):
+    """Launch to first frame over a filled article store: import, state loading, curses setup and first paint"""
+    import curses
+    started = time.perf_counter()
+    app, results = load_app(workdir)
+
+    def paint(stdscr):
+        init_colors()
+        app.merge_entries(app.load_archive_page()) # What main() shows before the fetch threads start
+        app.draw_feed(stdscr, app.entries, 0)
+        results["first_frame_s"] = time.perf_counter() - started
+        results["heavy_modules_loaded"] = sum(name in sys.modules for name in HEAVY_MODULES)
+
+    curses.wrapper(paint)
+    results["entries"] = len(app.entries)
+    return results
+
+STAGES = {"fetch": stage_fetch, "parse": stage_parse, "format": stage_format, "draw": stage_draw,
+          "startup": stage_startup}
+TERMINAL_STAGES = ("format", "draw", "startup") # Stages that need curses, run on a pseudo-terminal
+HEAVY_MODULES = ("requests", "feedparser", "bs4", "lxml.etree", "webbrowser", "asyncio") # Not needed for the first frame
+
+def worker_main(argv):
+    """Entry point of the worker interpreters: run one stage and write its result as JSON"""
+    stage, workdir, options_json, result_path = argv
+    result = STAGES[stage](workdir, json.loads(options_json))
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump(result, f)
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+def prepare_workdir(root, corpus, port):
+    """A directory with a copy of the application and a custom_feeds.json pointing at the server"""
+    workdir = tempfile.mkdtemp(prefix="run-", dir=root)
+    shutil.copy(APP_PATH, workdir)
+    with open(os.path.join(workdir, "custom_feeds.json"), "w", encoding="utf-8") as f:
+        json.dump(corpus.feed_list(port), f)
+    return workdir
+
+def run_worker(stage, workdir, options):
+    """Run a stage in a fresh interpreter, so imports, caches and module state start cold"""
+    result_path = os.path.join(workdir, f"{stage}-result.json")
+    command = [sys.executable, os.path.abspath(__file__), "--worker", stage, workdir, json.dumps(options), result_path]
+    if stage in TERMINAL_STAGES:
+        returncode = run_in_terminal(command, options["rows"], options["columns"])
+    else:
+        returncode = subprocess.run(command, stdout=subprocess.DEVNULL).returncode
+    if returncode != 0 or not os.path.exists(result_path):
+        return {"error": f"worker exited with status {returncode}"}
+    with open(result_path, encoding="utf-8") as f:
+        return json.load(f)
+
+def run_in_terminal(command, rows, columns):
+    """Run command on a pseudo-terminal of the given size, draining (and discarding) what it draws"""
+    try:
+        import fcntl
+        import pty
+        import struct
+        import termios
+    except ImportError:
+        return -1 # No pseudo-terminals on this platform
+    pid, fd = pty.fork()
+    if pid == 0:
+        fcntl.ioctl(sys.stdout.fileno(), termios.TIOCSWINSZ, struct.pack("HHHH", rows, columns, 0, 0))
+        env = dict(os.environ, TERM="xterm-256color")
+        env.pop("LINES", None)
+        env.pop("COLUMNS", None)
+        os.execve(command[0], command, env)
+    while True:
+        try:
+            if not os.read(fd, 65536):
+                break
+        except OSError:
+            break # EIO once the child closed the terminal
+    status = os.waitpid(pid, 0)[1]
+    # Decoded by hand: os.waitstatus_to_exitcode needs Python 3.9
+    if os.WIFEXITED(status):
+        return os.WEXITSTATUS(status)
+    return -os.WTERMSIG(status) if os.WIFSIGNALED(status) else -1
+
+def git_revision():
+    """Commit of the benchmarked tree, if it is a git checkout"""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=APP_PATH.parent,
+                                capture_output=True, text=True, timeout=10)
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def summarize(runs):
+    """Median over the repetitions of every numeric result, keeping the nesting of the results"""
+    summary = {}
+    for key in runs[0]:
+        values = [run.get(key) for run in runs]
+        if all(isinstance(value, dict) for value in values):
+            summary[key] = summarize(values)
+        elif all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+            summary[key] = statistics.median(values)
+    return summary
+
+def parse_args(argv=None):
+    """Command line options"""
+    parser = argparse.ArgumentParser(description="Benchmark ANCAP RSS Reader against a local synthetic feed server.")
+    parser.add_argument("--feeds", type=int, default=50, help="number of feeds served (default: 50)")
+    parser.add_argument("--entries", type=int, default=50, help="entries per feed (default: 50)")
+    parser.add_argument("--body-size", type=int, default=3000, help="approximate HTML bytes per entry (default: 3000)")
+    parser.add_argument("--format", choices=("rss", "atom", "mixed"), default="mixed", help="feed format (default: mixed)")
+    parser.add_argument("--latency", type=float, default=0, help="server latency per request in ms (default: 0)")
+    parser.add_argument("--jitter", type=float, default=0, help="random extra latency up to this many ms (default: 0)")
+    parser.add_argument("--error-rate", type=float, default=0, help="fraction of feeds answering 500 (default: 0)")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions of every stage (default: 3)")
+    parser.add_argument("--stages", default="fetch,parse,format,draw,startup",
+                        help=f"comma separated stages to run (default: all of {','.join(STAGES)})")
+    parser.add_argument("--width", type=int, default=80, help="text width for format_html_content (default: 80)")
+    parser.add_argument("--rows", type=int, default=50, help="terminal rows for the draw stage (default: 50)")
+    parser.add_argument("--columns", type=int, default=160, help="terminal columns for the draw stage (default: 160)")
+    parser.add_argument("--frames", type=int, default=200, help="frames drawn per draw measurement (default: 200)")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the generated corpus (default: 1)")
+    parser.add_argument("--output", default="benchmark.json", help="JSON results file (default: benchmark.json)")
+    args = parser.parse_args(argv)
+    unknown = set(args.stages.split(",")) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stage: {', '.join(sorted(unknown))}")
+    return args
+
+def main():
+    """Run the selected stages against the synthetic server and write the JSON results"""
+    if len(sys.argv) > 1 and sys.argv[1] == "--worker":
+        worker_main(sys.argv[2:])
+        return
+    args = parse_args()
+    stages = args.stages.split(",")
+    options = {"width": args.width, "rows": args.rows, "columns": args.columns, "frames": args.frames}
+
+    print(f"Generating {args.feeds} feeds x {args.entries} entries ({args.format}, ~{args.body_size} bytes per entry)...")
+    corpus = Corpus(args)
+    server = start_server(corpus)
+    port = server.server_address[1]
+    print(f"Serving on 127.0.0.1:{port} ({len(corpus.failing)} failing feeds, {args.latency:g} ms latency)")
+
+    runs = {stage: [] for stage in stages}
+    if "fetch" in stages:
+        runs["fetch_warm"] = []
+    root = tempfile.mkdtemp(prefix="ancap-bench-")
+    try:
+        for repetition in range(args.repeat):
+            for stage in stages:
+                workdir = prepare_workdir(root, corpus, port)
+                if stage == "startup":
+                    run_worker("fetch", workdir, options) # Start from a filled store, like a returning user
+                result = run_worker(stage, workdir, options)
+                runs[stage].append(result)
+                print(f"  [{repetition + 1}/{args.repeat}] {stage}: {json.dumps(result)[:150]}")
+                if stage == "fetch":
+                    # Same store and caches again: conditional requests answered with 304
+                    result = run_worker(stage, workdir, options)
+                    runs["fetch_warm"].append(result)
+                    print(f"  [{repetition + 1}/{args.repeat}] fetch_warm: {json.dumps(result)[:150]}")
+    finally:
+        server.shutdown()
+        shutil.rmtree(root, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": vars(args),
+        },
+        "summary": {stage: summarize(results) for stage, results in runs.items()
+                    if results and not any("error" in result for result in results)},
+        "runs": runs,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()